@@ -1,8 +1,16 @@
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    # optional, like in sms_api: orjson decodes the Dashboard responses faster than stdlib json
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 from decimal import Decimal, getcontext, InvalidOperation
 from datetime import datetime, timezone, timedelta
 from enum import Enum
+from time import monotonic
 from typing import Union
 
 from dt_sms_sdk.dashboard import DASHBOARD_HOST, DASHBOARD_USER_AGENT
@@ -287,7 +295,28 @@ class Account(object):
     password: str
 
     _token: str = None
-    _token_valid_until: datetime = datetime.now(timezone.utc)
+    _token_valid_until_wallclock: datetime = datetime.now(timezone.utc)
+    # monotonic deadline for the token, checked on every authenticated call since it is
+    # cheaper than constructing an aware datetime and immune to wall-clock adjustments
+    _token_deadline: float = 0.0
+
+    # a token this close to its expiry (in seconds) is refreshed proactively, so it
+    # cannot expire while the request using it is still in flight
+    _TOKEN_REFRESH_MARGIN = 60.0
+
+    @property
+    def _token_valid_until(self) -> datetime:
+        """
+        The timepoint when the stored token gets expired.
+        """
+        return self._token_valid_until_wallclock
+
+    @_token_valid_until.setter
+    def _token_valid_until(self, value: datetime):
+        # the monotonic deadline is derived once here, so the expiry check in token()
+        # never needs a datetime again
+        self._token_valid_until_wallclock = value
+        self._token_deadline = monotonic() + (value - datetime.now(timezone.utc)).total_seconds()
 
     def token(self) -> str:
         """
@@ -306,18 +335,17 @@ class Account(object):
         LoginError
             If the credentials could not be used to login into DT Developer Portal Dashboard
         """
-        if self._token and (datetime.now(timezone.utc) < self._token_valid_until):
+        if self._token and (monotonic() < self._token_deadline - Account._TOKEN_REFRESH_MARGIN):
             # stored token
             return self._token
         else:
             # get new token
             api_url = f'https://{DASHBOARD_HOST}/api/v1/oauth/token'
             headers = {
-                'User-Agent': f'{DASHBOARD_USER_AGENT}',
                 'Content-Type': 'application/x-www-form-urlencoded'
             }
             try:
-                response = requests.post(api_url, headers=headers, data={'username': self.username,
+                response = self._session.post(api_url, headers=headers, data={'username': self.username,
                                                                          'password': self.password,
                                                                          'grant_type': 'password'
                                                                          }
@@ -326,7 +354,7 @@ class Account(object):
                 logger.error('Could not reach DT Developer Dashboard: %s.', api_url)
                 raise DashboardNotReachableError()
             if response.status_code == 200:
-                token_response = response.json()
+                token_response = _json_loads(response.content)
                 self._token = token_response["access_token"]
                 self._token_valid_until = datetime.now(timezone.utc) + timedelta(0, token_response["expires_in"])
                 return self._token
@@ -359,17 +387,14 @@ class Account(object):
             All upcoming (and then not directly supported) Errors raises this base class error.
         """
         api_url = f'https://{DASHBOARD_HOST}/api/v1/wallet'
-        headers = {
-            'User-Agent': f'{DASHBOARD_USER_AGENT}',
-            'Authorization': f'Bearer {self.token()}'
-        }
+        self._session.headers['Authorization'] = f'Bearer {self.token()}'
         try:
-            response = requests.get(api_url, headers=headers)
+            response = self._session.get(api_url)
         except requests.exceptions.ConnectionError:
             logger.error('Could not reach DT Developer Dashboard: %s.', api_url)
             raise DashboardNotReachableError()
         if response.status_code == 200:
-            wallet_response = response.json()
+            wallet_response = _json_loads(response.content)
             return Wallet(wallet_response["balance"], Currency.from_str(wallet_response["currency"]))
         elif response.status_code == 401:
             logger.error("Token has not been accepted on the wallet endpoint.")
@@ -400,21 +425,14 @@ class Account(object):
             All upcoming (and then not directly supported) Errors raises this base class error.
         """
         api_url = f'https://{DASHBOARD_HOST}/api/v1/numbers'
-        headers = {
-            'User-Agent': f'{DASHBOARD_USER_AGENT}',
-            'Authorization': f'Bearer {self.token()}'
-        }
+        self._session.headers['Authorization'] = f'Bearer {self.token()}'
         try:
-            response = requests.get(api_url, headers=headers)
+            response = self._session.get(api_url)
         except requests.exceptions.ConnectionError:
             logger.error('Could not reach DT Developer Dashboard: %s.', api_url)
             raise DashboardNotReachableError()
         if response.status_code == 200:
-            numbers = response.json()
-            l: list[RegisteredPhoneNumber] = list()
-            for n in numbers:
-                l.append(RegisteredPhoneNumber.from_dict(n))
-            return l
+            return [RegisteredPhoneNumber.from_dict(n) for n in _json_loads(response.content)]
         elif response.status_code == 401:
             logger.error("Token has not been accepted on the RegisteredPhoneNumbers endpoint.")
             raise TokenError(token=self._token, valid_until=self._token_valid_until)
@@ -425,11 +443,8 @@ class Account(object):
             )
 
     def phone_numbers_for_sms_sender(self) -> list[E164PhoneNumber]:
-        result: list[E164PhoneNumber] = list()
-        for n in self.phone_numbers():
-            if n.status == PhoneNumberRegistrationStatus.VERIFIED and n.serviceId.startswith("/service/sms/"):
-                result.append(n.number)
-        return result
+        return [n.number for n in self.phone_numbers()
+                if n.status == PhoneNumberRegistrationStatus.VERIFIED and n.serviceId.startswith("/service/sms/")]
 
     def api_key(self) -> str:
         """
@@ -450,17 +465,14 @@ class Account(object):
             All upcoming (and then not directly supported) Errors raises this base class error.
         """
         api_url = f'https://{DASHBOARD_HOST}/api/v1/api-keys'
-        headers = {
-            'User-Agent': f'{DASHBOARD_USER_AGENT}',
-            'Authorization': f'Bearer {self.token()}'
-        }
+        self._session.headers['Authorization'] = f'Bearer {self.token()}'
         try:
-            response = requests.get(api_url, headers=headers)
+            response = self._session.get(api_url)
         except requests.exceptions.ConnectionError:
             logger.error('Could not reach DT Developer Dashboard: %s.', api_url)
             raise DashboardNotReachableError()
         if response.status_code == 200:
-            api_key_response = response.json()
+            api_key_response = _json_loads(response.content)
             return api_key_response["rawApiKey"]
         elif response.status_code == 401:
             logger.error("Token has not been accepted on the API Key endpoint.")
@@ -519,5 +531,22 @@ class Account(object):
         """
         self.username = username
         self.password = password
+        # all Dashboard endpoints live on one host, so a pooled session reuses the
+        # TLS connection across the token/wallet/numbers/api-keys calls
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=10))
+        # headers identical on every Dashboard request are attached to the session once
+        self._session.headers.update(
+            {
+                'User-Agent': DASHBOARD_USER_AGENT,
+                'Connection': 'keep-alive'
+            }
+        )
         if auto_login:
             self.token()
+
+    def close(self):
+        """
+        Closes the underlying HTTP session and its pooled connections.
+        """
+        self._session.close()
@@ -342,14 +342,16 @@ class ISO2Mapper(object):
         """
         result = 'ZZ'  # ISO2 default for 'unknown'
         l: int = len(number)
+        mapping = ISO2Mapper.country_calling_code_to_ISO2_mapping
         # a loop testing from small to larger parts will override an already found region
         # from a small code with a region of a longer code, so we do not need to define all
         # cc to region and can group common regions with short code and only need longer for the rare exceptions
         for i in range(ISO2Mapper.country_calling_code_min_length, ISO2Mapper.country_calling_code_max_length + 1):
             if l > i:
-                cc = number[1: i + 1]
-                if cc in ISO2Mapper.country_calling_code_to_ISO2_mapping.keys():
-                    result = ISO2Mapper.country_calling_code_to_ISO2_mapping[cc]
+                # one get() probe instead of a membership test followed by a second lookup
+                iso2 = mapping.get(number[1: i + 1])
+                if iso2 is not None:
+                    result = iso2
         return result
 
     @staticmethod
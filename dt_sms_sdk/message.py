@@ -1,3 +1,4 @@
+from functools import lru_cache
 from math import ceil
 from typing import Union
 
@@ -7,7 +8,7 @@ import logging
 logger = logging.getLogger(__name__)
 
 # Reference: http://www.unicode.org/Public/MAPPINGS/ETSI/GSM0338.TXT
-GSM_CHAR_FULL_SET = {
+GSM_CHAR_FULL_SET = frozenset({
     "\u0000",
     "\u000A", "\u000C", "\u000D",
     "\u0020", "\u0021", "\u0022", "\u0023", "\u0024", "\u0025", "\u0026", "\u0027",
@@ -37,11 +38,11 @@ GSM_CHAR_FULL_SET = {
     "\u03A0", "\u03A1", "\u03A3", "\u03A4", "\u03A5", "\u03A6", "\u03A7",
     "\u03A8", "\u03A9",
     "\u20AC"
-}
+})
 
 # removed one option from double mapping which is not supported by API
 # checked on 23rd December 2022 / Version 1.1.5
-GSM_CHAR_SET = GSM_CHAR_FULL_SET - {
+GSM_CHAR_SET = GSM_CHAR_FULL_SET - frozenset({
     "\u00E7",  # is treated as non GSM
     # "\u00C7",  # is treated as GSM
     #
@@ -86,7 +87,7 @@ GSM_CHAR_SET = GSM_CHAR_FULL_SET - {
     #
     # "\u005A", # is treated as GSM
     "\u0396"  # is treated as non GSM
-}
+})
 
 
 class Message(object):
@@ -193,8 +194,8 @@ class Message(object):
         bool
             is true if all characters of the string are from GSM character set
         """
-        used_chars = list(body)
-        return set(used_chars).issubset(GSM_CHAR_SET)
+        # issuperset consumes the string directly, without building a list and a set first
+        return GSM_CHAR_SET.issuperset(body)
 
     @staticmethod
     def _len_non_gsm_char(c) -> int:
@@ -228,16 +229,23 @@ class Message(object):
         int
             how many characters the message would need using non GSM character set
         """
-        result = 0
-        for c in s:
-            result += Message._len_non_gsm_char(c)
-        return result
+        # ASCII strings can not contain characters above the BMP, so their length is the
+        # number of UCS-2 slots already - isascii() just reads the internal string kind flag
+        if s.isascii():
+            return len(s)
+        # characters above the BMP need two UCS-2 slots, which is exactly the number of
+        # UTF-16 code units - so one C-level encode replaces the per-character Python loop
+        return len(s.encode('utf-16-le')) // 2
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def gsm_split_count(body: str) -> int:
         """
         Returns the number of segments the string has to be split
 
+        Results are memoized, so batches repeating the same template body
+        only pay the character scan once.
+
         Parameters
         ----------
         body: str
@@ -251,6 +259,12 @@ class Message(object):
         if not body:
             return 0
 
+        # typical SMS fast path: an ASCII body of up to 70 characters is a single segment
+        # on both branches below (at most 160 GSM slots resp. 70 UCS-2 units), so the
+        # character set classification can be skipped completely
+        if len(body) <= 70 and body.isascii():
+            return 1
+
         if Message.is_gsm_char_set(body):
             single_message_limit = 160
             multi_message_limit = 153
@@ -1,12 +1,32 @@
+from functools import cached_property, lru_cache
+
 from dt_sms_sdk.iso2_mapper import ISO2Mapper
 
 import logging
 logger = logging.getLogger(__name__)
 
-DIGITS = ("0", "1", "2", "3", "4", "5", "6", "7", "8", "9")
 MIN_DIGITS = 6  # basic minimum, while country code ranges 1..3, area code 0..5 and number 1..9, combination not under 6
 
 
+@lru_cache(maxsize=1024)
+def _number_to_iso2(number: str) -> str:
+    """
+    Caching wrapper around ISO2Mapper.number_to_iso2, so the country evaluation of
+    the same number (e.g. used as sender and recipient of one Message) runs only once.
+
+    Parameters
+    ----------
+    number: str
+        the phone number in E164 format to calculate the country for
+
+    Returns
+    -------
+    str
+        ISO2 Code of the country the number belongs to
+    """
+    return ISO2Mapper.number_to_iso2(number)
+
+
 class E164PhoneNumber(object):
     """
     Providing methods for calculating the country for a given phone number
@@ -60,14 +80,16 @@ class E164PhoneNumber(object):
                 if raising_error:
                     raise ValueError('Number of E164PhoneNumber must be a str starting with "+".')
                 return False
-            for c in number[1:]:
-                if c not in DIGITS:
-                    logger.debug(
-                        f'E164PhoneNumber: {number} uses different characters than "0".."9" after initial "+".')
-                    if raising_error:
-                        raise ValueError(
-                            'Number of E164PhoneNumber must be a str using only "0".."9" after initial "+".')
-                    return False
+            rest = number[1:]
+            # both str methods scan in C; isascii() keeps isdigit() from accepting
+            # non ASCII digit characters like superscripts or Arabic-Indic digits
+            if not (rest.isascii() and rest.isdigit()):
+                logger.debug(
+                    f'E164PhoneNumber: {number} uses different characters than "0".."9" after initial "+".')
+                if raising_error:
+                    raise ValueError(
+                        'Number of E164PhoneNumber must be a str using only "0".."9" after initial "+".')
+                return False
             return True
 
     def __init__(self, number: str, iso2: str = None):
@@ -108,10 +130,19 @@ class E164PhoneNumber(object):
 
         if iso2:
             if ISO2Mapper.basic_iso2_value_validation(iso2=iso2, raising_error=True):
+                # the assignment shadows the cached_property below in the instance dict
                 self.iso2 = iso2.upper()
-        else:
-            logger.debug('ISO2 of E164PhoneNumber calculated from its number.')
-            self.iso2 = ISO2Mapper.number_to_iso2(number)
+
+    @cached_property
+    def iso2(self) -> str:
+        """
+        The ISO2 code of the country the number belongs to - base for price calculation.
+
+        It is calculated from the number on first access (and then kept), so a number
+        which is only sent to - and never priced - does not pay for the country lookup.
+        """
+        logger.debug('ISO2 of E164PhoneNumber calculated from its number.')
+        return _number_to_iso2(self.number)
 
     def __eq__(self, other) -> bool:
         """
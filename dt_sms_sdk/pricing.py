@@ -1,8 +1,16 @@
 from typing import Dict, Optional
 from enum import Enum
 from decimal import Decimal, getcontext, InvalidOperation
+from functools import lru_cache
+from time import monotonic
 import requests
 
+try:
+    # orjson decodes the large price list JSON noticeably faster, but is an optional dependency
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 from dt_sms_sdk.dashboard import DASHBOARD_HOST, DASHBOARD_USER_AGENT
 from dt_sms_sdk.iso2_mapper import ISO2Mapper
 from dt_sms_sdk.message import Message
@@ -10,6 +18,37 @@ from dt_sms_sdk.message import Message
 import logging
 logger = logging.getLogger(__name__)
 
+# shared session, so repeated downloads reuse the pooled connection to the Dashboard host
+_session = requests.Session()
+
+# all ISO2 codes of the country name mapping, precomputed once for the coverage check in Pricing.__init__
+_MAPPED_ISO2_SET = frozenset(ISO2Mapper.country_name_to_ISO2_mapping.values())
+
+# shared Decimal constants, so the frequent miss/zero results do not re-parse a literal
+_DECIMAL_NAN = Decimal("NaN")
+_DECIMAL_ZERO = Decimal("0")
+
+
+@lru_cache(maxsize=1024)
+def _segments_for_body(body: str) -> int:
+    """
+    Number of SMS segments needed for a message body, cached by the body string.
+
+    Pricing the same Message for net and gross price (or the same body across a batch)
+    would otherwise re-run the GSM-7/UCS-2 scan of Message.gsm_split_count each time.
+
+    Parameters
+    ----------
+    body: str
+        the message body to be sent
+
+    Returns
+    -------
+    int
+        number of SMS the body has to be split into
+    """
+    return Message.gsm_split_count(body)
+
 
 class Currency(Enum):
     """
@@ -41,12 +80,13 @@ class Currency(Enum):
         ValueError
             if label can't be identified as Currency value at all
         """
-        if label and label.upper() in ('EUR', 'EURO', '€', '₠'):
-            return Currency.EURO
-        elif label in ("$", "﹩", "＄", "¢", "￠", "£", "￡", "¤", "¥", "￥", "֏", "؋", "߾", "߿", "৲", "৳", "৻", "૱", "௹",
-                       "฿", "៛", "₡", "₢", "₣", "₤", "₥", "₦", "₧", "₨", "₩", "￦", "₪", "₫", "₭", "₮", "₯", "₰", "₱",
-                       "₲", "₳", "₴", "₵", "₶", "₷", "₸", "₹", "₺", "₻", "₼", "₽", "₾", "₿", "꠸", "﷼", "𑿝", "𑿞", "𑿟",
-                       "𑿠", "𞋿", "𞲰"):
+        if label:
+            currency = _CURRENCY_BY_LABEL.get(label)
+            if currency is None:
+                currency = _CURRENCY_BY_LABEL.get(label.upper())
+            if currency is not None:
+                return currency
+        if label in _UNSUPPORTED_CURRENCY_SYMBOLS:
             logger.error(f'Currency: {label} could not be transferred to a valid Currency value, yet!')
             raise NotImplementedError("Given currency symbol could not be transferred to a valid Currency value, yet!")
         else:
@@ -54,6 +94,19 @@ class Currency(Enum):
             raise ValueError("Given value could not be transferred to a valid Currency value!")
 
 
+# precomputed label lookup, so the common case of Currency.from_str is a single dict probe
+_CURRENCY_BY_LABEL = {label: Currency.EURO for label in ('EUR', 'EURO', '€', '₠')}
+
+# all other Unicode currency symbols are recognized but not yet supported by the API;
+# frozenset membership rejects them with one hash probe instead of scanning a tuple
+_UNSUPPORTED_CURRENCY_SYMBOLS = frozenset({
+    "$", "﹩", "＄", "¢", "￠", "£", "￡", "¤", "¥", "￥", "֏", "؋", "߾", "߿", "৲", "৳", "৻", "૱", "௹",
+    "฿", "៛", "₡", "₢", "₣", "₤", "₥", "₦", "₧", "₨", "₩", "￦", "₪", "₫", "₭", "₮", "₯", "₰", "₱",
+    "₲", "₳", "₴", "₵", "₶", "₷", "₸", "₹", "₺", "₻", "₼", "₽", "₾", "₿", "꠸", "﷼", "𑿝", "𑿞", "𑿟",
+    "𑿠", "𞋿", "𞲰"
+})
+
+
 class Price(object):
     """
     A class representing a Price for sending an SMS message to a specific country
@@ -98,7 +151,6 @@ class Price(object):
         ValueError
             if parameter d is not transferable into a Decimal
         """
-        getcontext().prec = 4
         if isinstance(d, Decimal):
             return d
         elif isinstance(d, float):
@@ -219,17 +271,17 @@ class Pricing(object):
         str, optional
             ISO2 Code of the country referred in item or None if no match could be found or an error happens
         """
-        try:
-            country_name = item["country"]
-        except TypeError:
+        if not isinstance(item, dict):
             logger.debug('Item %s of Pricing is not a dictionary.', item)
-        except KeyError:
+            return None
+        country_name = item.get("country")
+        if country_name is None:
             logger.debug('Item %s of Pricing data does not have country key.', item)
-        else:
-            try:
-                return ISO2Mapper.country_name_to_ISO2_mapping[country_name]
-            except KeyError:
-                logger.warning('No ISO2 mapping for %s in Pricing data found.', country_name)
+            return None
+        iso2 = ISO2Mapper.country_name_to_ISO2_mapping.get(country_name)
+        if iso2 is None:
+            logger.warning('No ISO2 mapping for %s in Pricing data found.', country_name)
+        return iso2
 
     @staticmethod
     def _raw_item_to_price(item: dict) -> Optional[Price]:
@@ -258,12 +310,76 @@ class Pricing(object):
             else:
                 logger.debug('Incomplete pricing data provided for item: %s.', item)
 
+    @staticmethod
+    def _raw_item_to_iso2_and_price(item: dict) -> Optional[tuple]:
+        """
+        Fused variant of _raw_item_iso2_code and _raw_item_to_price, sharing the dictionary
+        check and country lookup, so each item of the raw Pricing Data is only probed once.
+
+        Parameters
+        ----------
+        item: dict
+            an item of the raw Pricing Data as provided by DT representing a single price point dictionary
+
+        Returns
+        -------
+        tuple, optional
+            a tuple of the ISO2 code and the Price object of the item or None if no match could
+            be found or an error happens
+        """
+        if not isinstance(item, dict):
+            logger.debug('Item %s of Pricing is not a dictionary.', item)
+            return None
+        country_name = item.get("country")
+        if country_name is None:
+            logger.debug('Item %s of Pricing data does not have country key.', item)
+            return None
+        iso2 = ISO2Mapper.country_name_to_ISO2_mapping.get(country_name)
+        if iso2 is None:
+            logger.warning('No ISO2 mapping for %s in Pricing data found.', country_name)
+            return None
+        try:
+            return iso2, Price(country=country_name, net_price=item["netPrice"], gross_price=item["grossPrice"],
+                               vat=item["vat"], currency=Currency.from_str(item["currency"]))
+        except KeyError:
+            logger.debug('Incomplete pricing data provided for country: %s.', country_name)
+        except (ValueError, NotImplementedError):
+            logger.debug('Invalid pricing data provided for country: %s.', country_name)
+
+    # already parsed pricelists keyed by a fingerprint of their content, so reloading
+    # an identical list does not reconstruct all Price objects again
+    _parsed_pricelist_cache: Dict[int, Dict[str, Price]] = {}
+    _parsed_pricelist_cache_size = 8
+
+    @staticmethod
+    def _raw_fingerprint(raw: list) -> Optional[int]:
+        """
+        Returns a hash over the content of a raw pricelist or None if the content is not hashable.
+
+        Parameters
+        ----------
+        raw: list
+            Pricing Data as provided by DT
+
+        Returns
+        -------
+        int, optional
+            a fingerprint of the pricelist content usable as cache key or None
+        """
+        try:
+            return hash(tuple(tuple(sorted(item.items())) for item in raw))
+        except (AttributeError, TypeError):
+            return None
+
     @staticmethod
     def prices_by_iso2(raw: list) -> Dict[str, Price]:
         """
         Converts a list of Pricing Data into a Dictionary with ISO2 code of the countries as key
         and a Price object as the value.
 
+        Already parsed pricelists are cached by their content, so repeated loading of an
+        identical list is answered without rebuilding the Price objects.
+
         Parameters
         ----------
         raw: list
@@ -277,17 +393,65 @@ class Pricing(object):
         """
         result: Dict[str, Price] = {}
 
+        fingerprint = None
+        if isinstance(raw, list):
+            fingerprint = Pricing._raw_fingerprint(raw)
+            cached = Pricing._parsed_pricelist_cache.get(fingerprint)
+            if cached is not None:
+                return dict(cached)
+
         if Pricing._raw_is_list(raw):
-            for p in raw:
-                iso2 = Pricing._raw_item_iso2_code(p)
-                if iso2:
-                    price = Pricing._raw_item_to_price(p)
-                    if price:
-                        result[iso2] = price
+            result = dict(filter(None, map(Pricing._raw_item_to_iso2_and_price, raw)))
             if not len(raw) == len(result):
                 logger.warning("Not all entries of Pricing data could be correctly loaded!")
+            if fingerprint is not None:
+                if len(Pricing._parsed_pricelist_cache) >= Pricing._parsed_pricelist_cache_size:
+                    Pricing._parsed_pricelist_cache.clear()
+                Pricing._parsed_pricelist_cache[fingerprint] = dict(result)
+        return result
+
+    @staticmethod
+    def float_prices_by_iso2(raw: list) -> Dict[str, tuple]:
+        """
+        Converts a list of Pricing Data into a Dictionary with ISO2 code of the countries as key
+        and a (net_price, gross_price, vat) tuple of plain floats as the value.
+
+        While price_data with its Decimal based Price objects stays the source for billing exact
+        calculations, this float based structure skips the Decimal object construction completely
+        and is sufficient (and much faster) for bulk cost estimations.
+
+        Parameters
+        ----------
+        raw: list
+            Pricing Data as provided by DT
+
+        Returns
+        -------
+        Dict[str, tuple]
+            dictionary keyed by ISO2 code with a (net_price, gross_price, vat) float tuple per country
+        """
+        result: Dict[str, tuple] = {}
+
+        if Pricing._raw_is_list(raw):
+            mapping = ISO2Mapper.country_name_to_ISO2_mapping
+            for item in raw:
+                if not isinstance(item, dict):
+                    logger.debug('Item %s of Pricing is not a dictionary.', item)
+                    continue
+                iso2 = mapping.get(item.get("country"))
+                if iso2 is None:
+                    logger.debug('No ISO2 mapping for item %s in Pricing data found.', item)
+                    continue
+                try:
+                    result[iso2] = (float(item["netPrice"]), float(item["grossPrice"]), float(item["vat"]))
+                except (KeyError, TypeError, ValueError):
+                    logger.debug('Incomplete pricing data provided for item: %s.', item)
         return result
 
+    # the offline pricelist built on first use of default(), so repeated calls do not
+    # re-evaluate the large list literal
+    _default_price_data: Optional[list] = None
+
     @staticmethod
     def default() -> list:
         """
@@ -298,7 +462,9 @@ class Pricing(object):
         list
             Offline Pricing Data from 24.12.2012
         """
-        return [
+        if Pricing._default_price_data is not None:
+            return list(Pricing._default_price_data)
+        Pricing._default_price_data = [
             {"country": "Belarus", "netPrice": 0.1458, "grossPrice": 0.1736, "vat": 0.19, "currency": "EUR"},
             {"country": "Timor-Leste", "netPrice": 0.0523, "grossPrice": 0.0623, "vat": 0.19, "currency": "EUR"},
             {"country": "Moldova", "netPrice": 0.0502, "grossPrice": 0.0598, "vat": 0.19, "currency": "EUR"},
@@ -479,35 +645,61 @@ class Pricing(object):
             {"country": "Indonesia", "netPrice": 0.1929, "grossPrice": 0.2296, "vat": 0.19, "currency": "EUR"},
             {"country": "Ukraine", "netPrice": 0.1169, "grossPrice": 0.1392, "vat": 0.19, "currency": "EUR"}
         ]
+        # a shallow copy keeps callers from mutating the cached list itself
+        return list(Pricing._default_price_data)
+
+    # last successful download together with its timestamp, so constructing several Pricing
+    # objects in a row does not re-download the rarely changing online pricelist
+    _download_cache: Optional[tuple] = None
+    _download_cache_ttl = 3600  # seconds
+
+    @staticmethod
+    def invalidate_download_cache():
+        """
+        Drops a cached download result, so the next call of download will query the endpoint again.
+        """
+        Pricing._download_cache = None
 
     @staticmethod
     def download() -> Optional[list]:
         """
         Pricing Data which will be loaded from https://developer.telekom.com/api/v1/prices
 
+        A successful download is cached for an hour, so that subsequent calls within that time
+        do not pay the network round-trip again.
+
         Returns
         -------
         list, optional
             Online Pricing Data or None if an Error happens
         """
+        now = monotonic()
+        if Pricing._download_cache and now - Pricing._download_cache[0] < Pricing._download_cache_ttl:
+            return Pricing._download_cache[1]
         api_url = f'https://{DASHBOARD_HOST}/api/v1/prices'
         headers = {
             'User-Agent': f'{DASHBOARD_USER_AGENT}'
         }
         try:
-            response = requests.get(api_url, headers=headers)
+            response = _session.get(api_url, headers=headers)
         except requests.exceptions.ConnectionError:
             logger.error('Could not reach Pricing Data at %s.', api_url)
             return None
         else:
+            # the status is checked before decoding, so error bodies are never parsed
+            if response.status_code != 200:
+                logger.error('Pricing Data at %s answered with status code %s.', api_url, response.status_code)
+                return None
             try:
-                result = response.json()
+                result = _json_loads(response.content)
                 if not Pricing._raw_is_list(result):
                     logger.error('Pricing Data from %s is not an expected list JSON object.', api_url)
                     result = None
-            except requests.exceptions.JSONDecodeError:
+            except ValueError:
                 logger.error('Could not parse Pricing Data from %s into a JSON object.', api_url)
                 return None
+        if result is not None:
+            Pricing._download_cache = (now, result)
         return result
 
     price_data: Dict[str, Price]
@@ -533,11 +725,16 @@ class Pricing(object):
         else:
             self.price_data = Pricing.prices_by_iso2(Pricing.default())
 
-        for v in ISO2Mapper.country_name_to_ISO2_mapping.values():
-            if v not in self.price_data.keys():
-                logger.warning(
-                    f'Loaded Pricing Data does not include Country, which is part of country name mapping: {v}'
-                )
+        # memoized successful lookups of price_by_iso2 together with the price_data they came from
+        self._price_lookup_cache: Dict[str, Price] = {}
+        self._price_lookup_cache_source = self.price_data
+
+        if logger.isEnabledFor(logging.WARNING):
+            missing = _MAPPED_ISO2_SET.difference(self.price_data.keys())
+            if missing:
+                # one aggregated record instead of one per country keeps construction cheap
+                logger.warning('Loaded Pricing Data does not include Countries, which are part of '
+                               'country name mapping: %s', ', '.join(sorted(missing)))
 
     def price_by_iso2(self, iso2: str) -> Optional[Price]:
         """
@@ -554,13 +751,24 @@ class Pricing(object):
             if ISO2 code could be found in price_data, corresponding Price object is returned
             otherwise None is returned.
         """
-        if isinstance(self.price_data, dict):
-            if iso2 in self.price_data.keys():
-                return self.price_data[iso2]
-            else:
-                logger.warning(f'No Price Data for ISO2 Code: {iso2}')
-        else:
+        if self.price_data is not self._price_lookup_cache_source:
+            # price_data has been replaced, so the memoized lookups are stale
+            self._price_lookup_cache_source = self.price_data
+            self._price_lookup_cache = {}
+        price = self._price_lookup_cache.get(iso2)
+        if price is not None:
+            return price
+        # __init__ guarantees a dict, so the successful lookup is a plain subscript and the
+        # defensive handling for externally replaced price_data only costs on the error paths
+        try:
+            price = self.price_data[iso2]
+        except KeyError:
+            logger.warning(f'No Price Data for ISO2 Code: {iso2}')
+        except TypeError:
             logger.error('Price Data stored in Pricing is not a dictionary.')
+        else:
+            self._price_lookup_cache[iso2] = price
+            return price
 
     def net_price_by_iso2(self, iso2: str) -> Decimal:
         """
@@ -577,12 +785,11 @@ class Pricing(object):
             if ISO2 code could be found in price_data, net price of corresponding Price object is returned
             otherwise Decimal("NaN") -> 'not a number' is returned.
         """
-        getcontext().prec = 4
         p = self.price_by_iso2(iso2)
         if p:
             return p.net_price
         else:
-            return Decimal("NaN")
+            return _DECIMAL_NAN
 
     def gross_price_by_iso2(self, iso2: str) -> Decimal:
         """
@@ -599,12 +806,11 @@ class Pricing(object):
             if ISO2 code could be found in price_data, gross price of corresponding Price object is returned
             otherwise Decimal("NaN") -> 'not a number' is returned.
         """
-        getcontext().prec = 4
         p = self.price_by_iso2(iso2)
         if p:
             return p.gross_price
         else:
-            return Decimal("NaN")
+            return _DECIMAL_NAN
 
     def message_net_price(self, message: Message) -> Decimal:
         """
@@ -624,11 +830,11 @@ class Pricing(object):
         """
         getcontext().prec = 4
         if not isinstance(message, Message):
-            return Decimal("NaN")
+            return _DECIMAL_NAN
         p = self.net_price_by_iso2(message.recipient.iso2)
         if p.is_nan():
             return p
-        return p * message.number_of_segments()
+        return p * _segments_for_body(message.body)
 
     def message_gross_price(self, message: Message) -> Decimal:
         """
@@ -648,11 +854,38 @@ class Pricing(object):
         """
         getcontext().prec = 4
         if not isinstance(message, Message):
-            return Decimal("NaN")
+            return _DECIMAL_NAN
         p = self.gross_price_by_iso2(message.recipient.iso2)
         if p.is_nan():
             return p
-        return p * message.number_of_segments()
+        return p * _segments_for_body(message.body)
+
+    @staticmethod
+    def _segments_by_iso2(list_of_messages: list[Message]) -> Dict[Optional[str], int]:
+        """
+        Groups a list of messages by the ISO2 code of their recipients and sums up the number
+        of segments per country, so a price lookup and Decimal multiplication is only needed
+        once per country instead of once per message.
+
+        Parameters
+        ----------
+        list_of_messages: list(Message)
+            List of Message objects which could be sent over the API
+
+        Returns
+        -------
+        Dict[Optional[str], int]
+            total number of segments keyed by recipient ISO2 code; entries which are no
+            Message objects are collected under the key None
+        """
+        segments: Dict[Optional[str], int] = {}
+        for m in list_of_messages:
+            if isinstance(m, Message):
+                iso2 = m.recipient.iso2
+                segments[iso2] = segments.get(iso2, 0) + _segments_for_body(m.body)
+            else:
+                segments[None] = segments.get(None, 0) + 1
+        return segments
 
     def messages_net_price(self, list_of_messages: list[Message], all_or_none: bool = False) -> Decimal:
         """
@@ -675,20 +908,22 @@ class Pricing(object):
             Total net price for message. If all_or_none is Ture and at least one message net price
             is 'not a number' the Decimal("NaN") -> 'not a number' is returned.
         """
-        result = Decimal("0")
-        if list_of_messages and len(list_of_messages) > 0:
-            for m in list_of_messages:
-                p = self.message_net_price(m)
-                if p.is_nan():
-                    if all_or_none:
-                        logger.info('Aborted summing up the net prices of a message list, '
-                                    'because at least one Price was not available.')
-                        return p
-                else:
-                    result += p
-        else:
+        getcontext().prec = 4
+        if not list_of_messages:
             logger.debug('List for messages_gross_price was None or empty.')
-        return result
+            return _DECIMAL_ZERO
+        priced_segments = [
+            (self.net_price_by_iso2(iso2) if iso2 is not None else _DECIMAL_NAN, number_of_segments)
+            for iso2, number_of_segments in Pricing._segments_by_iso2(list_of_messages).items()
+        ]
+        if all_or_none:
+            for p, _ in priced_segments:
+                if p.is_nan():
+                    logger.info('Aborted summing up the net prices of a message list, '
+                                'because at least one Price was not available.')
+                    return p
+        # sum() accumulates in C instead of rebinding a Decimal on every loop iteration
+        return sum((p * n for p, n in priced_segments if not p.is_nan()), _DECIMAL_ZERO)
 
     def messages_gross_price(self, list_of_messages: list[Message], all_or_none: bool = False) -> Decimal:
         """
@@ -711,17 +946,19 @@ class Pricing(object):
             Total gross price for message. If all_or_none is Ture and at least one message gross price
             is 'not a number' the Decimal("NaN") -> 'not a number' is returned.
         """
-        result = Decimal("0")
-        if list_of_messages and len(list_of_messages) > 0:
-            for m in list_of_messages:
-                p = self.message_gross_price(m)
-                if p.is_nan():
-                    if all_or_none:
-                        logger.info('Aborted summing up the gross prices of a message list, '
-                                    'because at least one Price was not available.')
-                        return p
-                else:
-                    result += p
-        else:
+        getcontext().prec = 4
+        if not list_of_messages:
             logger.debug('List for messages_gross_price was None or empty.')
-        return result
+            return _DECIMAL_ZERO
+        priced_segments = [
+            (self.gross_price_by_iso2(iso2) if iso2 is not None else _DECIMAL_NAN, number_of_segments)
+            for iso2, number_of_segments in Pricing._segments_by_iso2(list_of_messages).items()
+        ]
+        if all_or_none:
+            for p, _ in priced_segments:
+                if p.is_nan():
+                    logger.info('Aborted summing up the gross prices of a message list, '
+                                'because at least one Price was not available.')
+                    return p
+        # sum() accumulates in C instead of rebinding a Decimal on every loop iteration
+        return sum((p * n for p, n in priced_segments if not p.is_nan()), _DECIMAL_ZERO)
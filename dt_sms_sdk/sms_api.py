@@ -1,7 +1,20 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 from enum import Enum
-from typing import Union
+from functools import lru_cache
+from threading import Lock
+from time import monotonic, sleep
+from typing import List, Optional, Union
+
+try:
+    # if available, orjson decodes API responses in C and saves a few hundred microseconds per call
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 from dt_sms_sdk.message import Message
 from dt_sms_sdk.phone_number import E164PhoneNumber
@@ -157,24 +170,16 @@ class SMSAPIMessageStatus(Enum):
             An SMSAPIMessageStatus if value could be mapped or None if not.
         """
         if label:
-            temp_label = label.upper()
-            if temp_label == 'ACCEPTED':
-                return SMSAPIMessageStatus.ACCEPTED
-            elif temp_label == 'QUEUED':
-                return SMSAPIMessageStatus.QUEUED
-            elif temp_label == 'UNDELIVERED':
-                return SMSAPIMessageStatus.UNDELIVERED
-            elif temp_label == 'SENDING':
-                return SMSAPIMessageStatus.SENDING
-            elif temp_label == 'SENT':
-                return SMSAPIMessageStatus.SENT
-            elif temp_label == 'DELIVERED':
-                return SMSAPIMessageStatus.DELIVERED
-            elif temp_label == 'FAILED':
-                return SMSAPIMessageStatus.FAILED
+            status = _SMS_API_MESSAGE_STATUS_BY_NAME.get(label.upper())
+            if status is not None:
+                return status
         logger.error(f'SMSAPIMessageStatus: {label} could not be transferred to a valid SMSAPIMessageStatus value!')
 
 
+# precomputed name lookup, so SMSAPIMessageStatus.from_str is a single dict probe per response
+_SMS_API_MESSAGE_STATUS_BY_NAME = {m.name: m for m in SMSAPIMessageStatus}
+
+
 class SMSMessageDirection(Enum):
     """
     Enumeration used in SMSAPIResponse Class to specify the direction of the request.
@@ -198,16 +203,43 @@ class SMSMessageDirection(Enum):
         SMSMessageDirection
             An SMSMessageDirection if value could be mapped or None if not.
         """
-        if label and label.upper() == 'OUTBOUND-API':
-            return SMSMessageDirection.OUTBOUND
+        if label:
+            direction = _SMS_MESSAGE_DIRECTION_BY_VALUE.get(label.upper())
+            if direction is not None:
+                return direction
         logger.error(f'SMSMessageDirection: {label} could not be transferred to a valid SMSMessageDirection value!')
 
 
+# precomputed value lookup, analogous to the status one above
+_SMS_MESSAGE_DIRECTION_BY_VALUE = {m.value.upper(): m for m in SMSMessageDirection}
+
 SMSAPI_DATETIME_FORMAT = '%a, %d %b %Y %H:%M:%S %z'
 SMSAPI_HOST = 'api.telekom.com'
 SMSAPI_USER_AGENT = 'dt-sms-api-sdk-python 1.0'
 
 
+@lru_cache(maxsize=256)
+def _parse_api_datetime(value: str) -> datetime:
+    """
+    Parses a timestamp of the API (SMSAPI_DATETIME_FORMAT is RFC 2822) into a datetime.
+
+    The RFC 2822 parser of the email package avoids recompiling a strptime format string on
+    every response and the lru_cache covers that date_created/date_updated are mostly identical
+    on fresh messages and repeat across polled status calls.
+
+    Parameters
+    ----------
+    value: str
+        a timestamp as used on the API in SMSAPI_DATETIME_FORMAT
+
+    Returns
+    -------
+    datetime
+        the parsed timestamp
+    """
+    return parsedate_to_datetime(value)
+
+
 class SMSAPIResponse(object):
     """
     A class representing a response of the DT SMS API for sending an SMS
@@ -296,17 +328,20 @@ class SMSAPIResponse(object):
         """
 
         self.sid = sid
-        self.date_created = datetime.strptime(date_created, SMSAPI_DATETIME_FORMAT)
-        self.date_updated = datetime.strptime(date_updated, SMSAPI_DATETIME_FORMAT)
+        self.date_created = _parse_api_datetime(date_created)
+        self.date_updated = _parse_api_datetime(date_updated)
         self.status = SMSAPIMessageStatus.from_str(message_status)
         self.message = Message(sender=message_from, recipient=E164PhoneNumber(message_to), body=message_body)
         self.uri = uri
         self.num_segments = num_segments
         self.api_version = api_version
         self.direction = SMSMessageDirection.from_str(direction)
-        if not self.num_segments == self.message.number_of_segments():
-            logger.warning(f'DT SMS API split the message into {self.num_segments} '
-                           f'while SDK calculates {self.message.number_of_segments()} splits!')
+        if logger.isEnabledFor(logging.WARNING):
+            # the sanity check re-encodes the body, so it is skipped when nobody listens to the warning
+            own_segments = self.message.number_of_segments()
+            if not self.num_segments == own_segments:
+                logger.warning(f'DT SMS API split the message into {self.num_segments} '
+                               f'while SDK calculates {own_segments} splits!')
 
     @staticmethod
     def from_dict(d: dict):
@@ -356,6 +391,17 @@ class SMSAPIClient(object):
     """
     api_key: str
 
+    # static endpoint URLs, precomputed once instead of being formatted on every call
+    _SEND_URL = f'https://{SMSAPI_HOST}/service/sms/v1/messages'
+    _STATUS_URL_PREFIX = f'https://{SMSAPI_HOST}/service/sms/v1/messages/'
+
+    # error factories for the status codes handled identically by send and status; the
+    # dict dispatch keeps the hot path at a single status_code comparison for 200
+    _COMMON_ERRORS = {
+        401: lambda self: NotAuthorizedError(api_key=self.api_key),
+        500: lambda self: InternalSMSAPIError()
+    }
+
     def __init__(self, api_key: str):
         """
         Parameters
@@ -369,6 +415,33 @@ class SMSAPIClient(object):
             A SMSAPIClient object which could be used to invoke SMS API endpoints at the DT Developer Portal
         """
         self.api_key = api_key
+        # a persistent session keeps the TLS connection to the API host alive between requests;
+        # the headers identical on every request are attached to it once
+        self._session = requests.Session()
+        # transient failures (429 and 5xx) are retried with backoff inside urllib3, so they
+        # never surface as errors to the caller unless the retries are exhausted
+        retry = Retry(
+            total=3,
+            backoff_factor=0.25,
+            status_forcelist=(429, 502, 503, 504),
+            allowed_methods=frozenset(['GET', 'POST']),
+            respect_retry_after_header=True
+        )
+        self._session.mount('https://', HTTPAdapter(max_retries=retry))
+        self._session.headers.update(
+            {
+                'User-Agent': SMSAPI_USER_AGENT,
+                'X-API-Key': api_key
+            }
+        )
+        # only the Content-Type is specific to the send request
+        self._post_headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+
+    def close(self):
+        """
+        Closes the underlying HTTP session and its pooled connections.
+        """
+        self._session.close()
 
     def status(self, sid: Union[str, SMSAPIResponse]) -> SMSAPIResponse:
         """
@@ -403,30 +476,25 @@ class SMSAPIClient(object):
             api_url = f'https://{SMSAPI_HOST}{sid.uri}'
             m_id = sid.sid
         elif isinstance(sid, str):
-            api_url = f'https://{SMSAPI_HOST}/service/sms/v1/messages/{sid}'
+            api_url = self._STATUS_URL_PREFIX + sid
             m_id = sid
         else:
             logger.error('Without valid sid for the API request, the SDK could not query the status.')
             raise ValueError(f'Given sid {sid} can\'t be used to query status from the DT SMS API')
-        headers = {
-            'User-Agent': f'{SMSAPI_USER_AGENT}',
-            'X-API-Key': self.api_key
-        }
         try:
-            response = requests.get(api_url, headers=headers)
-        except requests.exceptions.ConnectionError:
+            response = self._session.get(api_url)
+        except (requests.exceptions.ConnectionError, requests.exceptions.RetryError):
             logger.error('Could not reach SMS API: %s.', api_url)
             raise SMSAPINotReachableError()
         if response.status_code == 200:
-            sent_response = response.json()
+            sent_response = _json_loads(response.content)
             return SMSAPIResponse.from_dict(sent_response)
-        elif response.status_code == 401:
-            raise NotAuthorizedError(api_key=self.api_key)
+        error = self._COMMON_ERRORS.get(response.status_code)
+        if error is not None:
+            raise error(self)
         elif response.status_code == 404:
             logger.error("Requesting status of a message results in 404 Error")
             raise MessageNotFoundError(m_id)
-        elif response.status_code == 500:
-            raise InternalSMSAPIError()
         else:
             raise SMSAPIError(
                     f'While querying the message status, '
@@ -464,44 +532,92 @@ class SMSAPIClient(object):
         InternalSMSAPIError
             The DT SMS API has an internal error
         """
-        api_url = f'https://{SMSAPI_HOST}/service/sms/v1/messages'
-        headers = {
-            'User-Agent': f'{SMSAPI_USER_AGENT}',
-            'X-API-Key': self.api_key,
-            'Content-Type': 'application/x-www-form-urlencoded'
-        }
+        api_url = self._SEND_URL
         try:
-            response = requests.post(api_url, headers=headers, data=message.data())
-        except requests.exceptions.ConnectionError:
+            response = self._session.post(api_url, headers=self._post_headers, data=message.data())
+        except (requests.exceptions.ConnectionError, requests.exceptions.RetryError):
             logger.error('Could not reach SMS API: %s.', api_url)
             raise SMSAPINotReachableError()
         if response.status_code == 200:
-            sent_response = response.json()
+            sent_response = _json_loads(response.content)
             return SMSAPIResponse.from_dict(sent_response)
-        elif response.status_code == 401:
-            raise NotAuthorizedError(api_key=self.api_key)
+        error = self._COMMON_ERRORS.get(response.status_code)
+        if error is not None:
+            raise error(self)
         elif response.status_code == 415:
             logger.error("Sending an SMS results in 415 Error, "
                          "which indicates that SDK has become incompatible with API")
             raise UnsupportedMediaTypeError("Sending an SMS results in 415 Error, "
                                             "which indicates that SDK has become incompatible with API")
         elif response.status_code == 422:
-            error_response = response.json()
-            if error_response["message"].startswith("Number: ") and \
-                    error_response["message"].endswith(" cannot be used because is not verified"):
+            # matching the discriminator strings on the raw bytes lets the known error cases
+            # skip the JSON decode completely
+            body = response.content
+            if b'Number: ' in body and b' cannot be used because is not verified' in body:
                 raise SenderNumberNotVerifiedError(api_key=self.api_key, sender_number=str(message.sender))
-            elif error_response["message"] == "Not enough money on the wallet":
+            elif b'Not enough money on the wallet' in body:
                 raise NotEnoughMoneyOnTheWalletError(api_key=self.api_key)
-            elif error_response["message"].startswith("No routing available for sms from:"):
+            elif b'No routing available for sms from:' in body:
                 raise NoRouteToRecipientNumberError(recipient_number=str(message.recipient))
             else:
+                error_response = _json_loads(body)
                 raise SMSAPIError(
                     f'API raised an 422 error with an unknown message: "{error_response["message"]}"'
                 )
-        elif response.status_code == 500:
-            raise InternalSMSAPIError()
         else:
             raise SMSAPIError(
                     f'While sending a message, '
                     f'the API raised a new {response.status_code} error with message: "{response.text}"'
             )
+
+    def send_many(self, messages: List[Message], max_concurrency: int = 10,
+                  rate_per_sec: Optional[float] = None) -> List[SMSAPIResponse]:
+        """
+        This method will send several Messages to the DT SMS API concurrently
+
+        The Messages are sent over the shared session of the SMSAPIClient by a thread pool,
+        so up to max_concurrency requests are in flight at the same time instead of waiting
+        for each round-trip one after the other.
+
+        Parameters
+        ----------
+        messages: List[Message]
+            The Message objects which should be sent
+        max_concurrency: int
+            maximum number of requests in flight at the same time, by default 10
+            (the connection pool size of the underlying session)
+        rate_per_sec: float, optional
+            if given, the overall sending rate is capped at that many requests per second,
+            so a provider side rate limit is not run into
+
+        Returns
+        -------
+        List[SMSAPIResponse]
+            The SMSAPIResponse objects in the order of the given Messages
+
+        Raises
+        ------
+        SMSAPIError
+            The first error raised while sending one of the Messages, see send method
+            for the specific subclasses.
+        """
+        if not messages:
+            return []
+        send = self.send
+        if rate_per_sec:
+            # all workers draw their start slot from one clock, spacing the requests evenly
+            interval = 1.0 / rate_per_sec
+            slot_lock = Lock()
+            next_slot = [monotonic()]
+
+            def send(message: Message) -> SMSAPIResponse:
+                with slot_lock:
+                    now = monotonic()
+                    wait = next_slot[0] - now
+                    next_slot[0] = max(next_slot[0], now) + interval
+                if wait > 0:
+                    sleep(wait)
+                return self.send(message)
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            return list(executor.map(send, messages))
@@ -3,6 +3,58 @@ from dt_sms_sdk import SenderNumberNotVerifiedError, NotEnoughMoneyOnTheWalletEr
 from dt_sms_sdk.pricing import Pricing
 from dt_sms_sdk.message import Message
 
+import json
+import os
+import random
+import tempfile
+import time
+
+
+# the online price list rarely changes, so it is cached on disk and only
+# re-downloaded after PRICE_CACHE_TTL seconds
+PRICE_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "dt_sms_sdk", "prices.json")
+PRICE_CACHE_TTL = 86400  # seconds
+
+
+def with_retry(fn, retries=3, base=0.5):
+    """
+    Calls fn and retries it with exponential backoff and a little jitter
+    when the service is temporarily not reachable; business errors are not retried.
+    """
+    for attempt in range(retries):
+        try:
+            return fn()
+        except SMSAPINotReachableError:
+            if attempt == retries - 1:
+                raise
+            time.sleep(min(60, base * 2 ** attempt + random.random() * 0.1))
+
+
+def load_cached_prices():
+    """
+    Returns the online price list from the local cache file if it is still fresh,
+    otherwise downloads it and updates the cache atomically.
+    """
+    try:
+        if time.time() - os.path.getmtime(PRICE_CACHE_FILE) < PRICE_CACHE_TTL:
+            with open(PRICE_CACHE_FILE) as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+    prices = Pricing.download()
+    if prices:
+        try:
+            cache_dir = os.path.dirname(PRICE_CACHE_FILE)
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir)
+            with os.fdopen(fd, "w") as f:
+                json.dump(prices, f)
+            os.replace(tmp_path, PRICE_CACHE_FILE)
+        except OSError:
+            pass
+    return prices
+
+
 API_TOKEN = ""
 SENDER_PHONENUMBER = ""
 
@@ -14,11 +66,11 @@ if not API_TOKEN or not SENDER_PHONENUMBER:
 
 print(f'You have entered {SENDER_PHONENUMBER}, which will be used for sending (sender and receiver).')
 
-prices = Pricing.download()
+prices = load_cached_prices()
 if prices:
-    print('Online price list was downloaded successfull.')
+    print('Online price list was loaded successfull.')
 else:
-    print('Online price list could not be downloaded - offline default price list will be used.')
+    print('Online price list could not be loaded - offline default price list will be used.')
 
 pricing = Pricing(prices)
 
@@ -49,7 +101,7 @@ if input().lower() != 'yes':
 sms_client = SMSAPIClient(api_key=API_TOKEN)
 
 try:
-    response = sms_client.send(message=message)
+    response = with_retry(lambda: sms_client.send(message=message))
 except NoRouteToRecipientNumberError:
     # this is a hypothetical path, because in the example we use a registered phone number
     # which was verified by the portal via an SMS
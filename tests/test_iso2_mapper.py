@@ -5,30 +5,30 @@ from dt_sms_sdk.iso2_mapper import ISO2Mapper
 
 class DTSMSSDKISO2MapperTest(TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # the mappings are static, so the sets are built once for all tests of the class
+        cls.name_iso = set(ISO2Mapper.country_name_to_ISO2_mapping.values())
+        cls.cc_iso = set(ISO2Mapper.country_calling_code_to_ISO2_mapping.values())
+        cls.no_route = frozenset(ISO2Mapper.no_routing_of_ISO2)
+
     def test_all_iso_of_county_are_unique(self):
         """
         Each iso must have only one country name, because that will be the reference for pricing.
         While normally an iso could have many full names, we could not correlate name<->iso<->pricing
         """
-        iso2 = set(val for val in ISO2Mapper.country_name_to_ISO2_mapping.values())
-        self.assertEqual(len(iso2), len(ISO2Mapper.country_name_to_ISO2_mapping.values()),
+        self.assertEqual(len(self.name_iso), len(ISO2Mapper.country_name_to_ISO2_mapping.values()),
                          msg='Not all iso2 codes in ISO2Mapper.country_calling_code_to_ISO2_mapping are unique')
 
     def test_all_iso_of_country_in_iso_of_phone_number(self):
         """
         Check we can find all iso (and therefore pricing) by country calling codes
         """
-        iso2 = set(val for val in ISO2Mapper.country_name_to_ISO2_mapping.values())
-
-        missing = 0
-        for c in iso2:
-            if c not in ISO2Mapper.country_calling_code_to_ISO2_mapping.values():
-                missing += 1
-                print(f'{c} is missing in country_calling_code_to_ISO2_mapping')
-
+        # set difference runs in C over the hashed members instead of a per-element scan
+        missing = self.name_iso - self.cc_iso
         self.assertEqual(
-            missing, 0,
-            msg=f'{missing} iso2 country codes are missing in ISO2Mapper.country_calling_code_to_ISO2_mapping'
+            missing, set(),
+            msg=f'{sorted(missing)} iso2 country codes are missing in ISO2Mapper.country_calling_code_to_ISO2_mapping'
         )
 
     def test_all_iso_of_phone_number_are_in_iso_of_country_xor_in_no_routing(self):
@@ -36,19 +36,12 @@ class DTSMSSDKISO2MapperTest(TestCase):
         The iso code from country calling code to iso code mapping must be either in the
         country name to iso (for pricing data) or in the no route list (no pricing).
         """
-        iso2 = set(val for val in ISO2Mapper.country_calling_code_to_ISO2_mapping.values())
-
-        missing = 0
-        double = 0
-        for c in iso2:
-            if c not in ISO2Mapper.country_name_to_ISO2_mapping.values() and c not in ISO2Mapper.no_routing_of_ISO2:
-                missing += 1
-                print(f'{c} is missing in ISO2Mapper.country_name_to_ISO2_mapping AND ISO2Mapper.no_routing_of_ISO2')
-            if c in ISO2Mapper.country_name_to_ISO2_mapping.values() and c in ISO2Mapper.no_routing_of_ISO2:
-                double += 1
-                print(f'{c} is in both, ISO2Mapper.country_name_to_ISO2_mapping AND ISO2Mapper.no_routing_of_ISO2')
-
-        self.assertEqual(missing, 0, msg=f'{missing} iso2 country codes are missing in '
-                                         f'ISO2Mapper.country_name_to_ISO2_mapping AND ISO2Mapper.no_routing_of_ISO2')
-        self.assertEqual(missing, 0, msg=f'{double} iso2 country codes are in both, '
-                                         f'ISO2Mapper.country_name_to_ISO2_mapping AND ISO2Mapper.no_routing_of_ISO2')
+        missing = self.cc_iso - self.name_iso - self.no_route
+        double = self.cc_iso & self.name_iso & self.no_route
+
+        self.assertEqual(missing, set(),
+                         msg=f'{sorted(missing)} iso2 country codes are missing in '
+                             f'ISO2Mapper.country_name_to_ISO2_mapping AND ISO2Mapper.no_routing_of_ISO2')
+        self.assertEqual(double, set(),
+                         msg=f'{sorted(double)} iso2 country codes are in both, '
+                             f'ISO2Mapper.country_name_to_ISO2_mapping AND ISO2Mapper.no_routing_of_ISO2')
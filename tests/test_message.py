@@ -6,6 +6,22 @@ from dt_sms_sdk.phone_number import E164PhoneNumber
 
 class DTSMSSDKMessageTest(TestCase):
 
+    # bodies at the exact segment thresholds, built by repetition instead of literal chains;
+    # a GSM character is one unit, "\U0001F447" takes two UTF-16 units in UCS-2 encoding
+    GSM_160 = "0123456789" * 16
+    GSM_161 = "0123456789" * 16 + "1"
+    GSM_306 = "0123456789" * 30 + "012345"
+    GSM_307 = "0123456789" * 30 + "0123456"
+    UCS2_70 = "\U0001F447" * 35
+    UCS2_71 = "\U0001F447" * 35 + "1"
+    UCS2_134 = "\U0001F447" * 67
+    UCS2_135 = "\U0001F447" * 67 + "1"
+    UCS2_70_MIXED = "0123456789" * 6 + "012345678" + "\uFFFF"  # 70 chars, but non GSM
+    UCS2_135_MIXED = "0123456789" * 13 + "0123" + "\uFFFF"  # 135 chars, but non GSM
+
+    # one shared recipient for the constructor tests, parsed once for the class
+    RECIPIENT = E164PhoneNumber("+491755555555")
+
     def test_is_gsm_char_set(self):
         self.assertEqual(Message._len_non_gsm_char("A"), 1)
         self.assertEqual(Message._len_non_gsm_char("\uFFFF"), 1)
@@ -26,220 +42,55 @@ class DTSMSSDKMessageTest(TestCase):
 
     def test_gsm_split_count_1(self):
         self.assertEqual(Message.gsm_split_count("0"), 1)
-        self.assertEqual(Message.gsm_split_count("0123456789" +  # 010
-                                                 "0123456789" +  # 020
-                                                 "0123456789" +  # 030
-                                                 "0123456789" +  # 040
-                                                 "0123456789" +  # 050
-                                                 "0123456789" +  # 060
-                                                 "0123456789" +  # 070
-                                                 "0123456789" +  # 080
-                                                 "0123456789" +  # 090
-                                                 "0123456789" +  # 100
-                                                 "0123456789" +  # 110
-                                                 "0123456789" +  # 120
-                                                 "0123456789" +  # 130
-                                                 "0123456789" +  # 140
-                                                 "0123456789" +  # 150
-                                                 "0123456789"    # 160
-                                                 ), 1)
-        self.assertEqual(Message.gsm_split_count("👇"), 1)
-        self.assertEqual(Message.gsm_split_count("👇👇👇👇👇" +  # 10
-                                                 "👇👇👇👇👇" +  # 20
-                                                 "👇👇👇👇👇" +  # 30
-                                                 "👇👇👇👇👇" +  # 40
-                                                 "👇👇👇👇👇" +  # 50
-                                                 "👇👇👇👇👇" +  # 60
-                                                 "👇👇👇👇👇"    # 70
-                                                 ), 1)
-        self.assertEqual(Message.gsm_split_count("0123456789" +  # 010
-                                                 "0123456789" +  # 020
-                                                 "0123456789" +  # 030
-                                                 "0123456789" +  # 040
-                                                 "0123456789" +  # 050
-                                                 "0123456789" +  # 060
-                                                 "012345678" +   # 069
-                                                 "\uFFFF"        # 070, but non GSM
-                                                 ), 1)
+        self.assertEqual(Message.gsm_split_count(self.GSM_160), 1)
+        self.assertEqual(Message.gsm_split_count("\U0001F447"), 1)
+        self.assertEqual(Message.gsm_split_count(self.UCS2_70), 1)
+        self.assertEqual(Message.gsm_split_count(self.UCS2_70_MIXED), 1)
 
     def test_gsm_split_count_2(self):
-        self.assertEqual(Message.gsm_split_count("0123456789" +  # 010
-                                                 "0123456789" +  # 020
-                                                 "0123456789" +  # 030
-                                                 "0123456789" +  # 040
-                                                 "0123456789" +  # 050
-                                                 "0123456789" +  # 060
-                                                 "0123456789" +  # 070
-                                                 "0123456789" +  # 080
-                                                 "0123456789" +  # 090
-                                                 "0123456789" +  # 100
-                                                 "0123456789" +  # 110
-                                                 "0123456789" +  # 120
-                                                 "0123456789" +  # 130
-                                                 "0123456789" +  # 140
-                                                 "0123456789" +  # 150
-                                                 "01234567891"   # 161
-                                                 ), 2)
-        self.assertEqual(Message.gsm_split_count("0123456789" +  # 010
-                                                 "0123456789" +  # 020
-                                                 "0123456789" +  # 030
-                                                 "0123456789" +  # 040
-                                                 "0123456789" +  # 050
-                                                 "0123456789" +  # 060
-                                                 "0123456789" +  # 070
-                                                 "0123456789" +  # 080
-                                                 "0123456789" +  # 090
-                                                 "0123456789" +  # 100
-                                                 "0123456789" +  # 110
-                                                 "0123456789" +  # 120
-                                                 "0123456789" +  # 130
-                                                 "0123456789" +  # 140
-                                                 "0123456789" +  # 150
-                                                 "0123456789" +  # 160
-                                                 "0123456789" +  # 170
-                                                 "0123456789" +  # 180
-                                                 "0123456789" +  # 190
-                                                 "0123456789" +  # 200
-                                                 "0123456789" +  # 210
-                                                 "0123456789" +  # 220
-                                                 "0123456789" +  # 230
-                                                 "0123456789" +  # 240
-                                                 "0123456789" +  # 250
-                                                 "0123456789" +  # 260
-                                                 "0123456789" +  # 270
-                                                 "0123456789" +  # 280
-                                                 "0123456789" +  # 290
-                                                 "0123456789" +  # 300
-                                                 "012345"        # 306
-                                                 ), 2)
-        self.assertEqual(Message.gsm_split_count("👇👇👇👇👇" +  # 10
-                                                 "👇👇👇👇👇" +  # 20
-                                                 "👇👇👇👇👇" +  # 30
-                                                 "👇👇👇👇👇" +  # 40
-                                                 "👇👇👇👇👇" +  # 50
-                                                 "👇👇👇👇👇" +  # 60
-                                                 "👇👇👇👇👇1"   # 71
-                                                 ), 2)
-        self.assertEqual(Message.gsm_split_count("👇👇👇👇👇" +  # 010
-                                                 "👇👇👇👇👇" +  # 020
-                                                 "👇👇👇👇👇" +  # 030
-                                                 "👇👇👇👇👇" +  # 040
-                                                 "👇👇👇👇👇" +  # 050
-                                                 "👇👇👇👇👇" +  # 060
-                                                 "👇👇👇👇👇" +  # 070
-                                                 "👇👇👇👇👇" +  # 080
-                                                 "👇👇👇👇👇" +  # 090
-                                                 "👇👇👇👇👇" +  # 100
-                                                 "👇👇👇👇👇" +  # 110
-                                                 "👇👇👇👇👇" +  # 120
-                                                 "👇👇👇👇👇" +  # 130
-                                                 "👇👇"          # 134
-                                                 ), 2)
+        self.assertEqual(Message.gsm_split_count(self.GSM_161), 2)
+        self.assertEqual(Message.gsm_split_count(self.GSM_306), 2)
+        self.assertEqual(Message.gsm_split_count(self.UCS2_71), 2)
+        self.assertEqual(Message.gsm_split_count(self.UCS2_134), 2)
+
     def test_gsm_split_count_3(self):
-        self.assertEqual(Message.gsm_split_count("0123456789" +  # 010
-                                                 "0123456789" +  # 020
-                                                 "0123456789" +  # 030
-                                                 "0123456789" +  # 040
-                                                 "0123456789" +  # 050
-                                                 "0123456789" +  # 060
-                                                 "0123456789" +  # 070
-                                                 "0123456789" +  # 080
-                                                 "0123456789" +  # 090
-                                                 "0123456789" +  # 100
-                                                 "0123456789" +  # 110
-                                                 "0123456789" +  # 120
-                                                 "0123456789" +  # 130
-                                                 "0123456789" +  # 140
-                                                 "0123456789" +  # 150
-                                                 "0123456789" +  # 160
-                                                 "0123456789" +  # 170
-                                                 "0123456789" +  # 180
-                                                 "0123456789" +  # 190
-                                                 "0123456789" +  # 200
-                                                 "0123456789" +  # 210
-                                                 "0123456789" +  # 220
-                                                 "0123456789" +  # 230
-                                                 "0123456789" +  # 240
-                                                 "0123456789" +  # 250
-                                                 "0123456789" +  # 260
-                                                 "0123456789" +  # 270
-                                                 "0123456789" +  # 280
-                                                 "0123456789" +  # 290
-                                                 "0123456789" +  # 300
-                                                 "0123456"       # 307
-                                                 ), 3)
-        self.assertEqual(Message.gsm_split_count("👇👇👇👇👇" +  # 010
-                                                 "👇👇👇👇👇" +  # 020
-                                                 "👇👇👇👇👇" +  # 030
-                                                 "👇👇👇👇👇" +  # 040
-                                                 "👇👇👇👇👇" +  # 050
-                                                 "👇👇👇👇👇" +  # 060
-                                                 "👇👇👇👇👇" +  # 070
-                                                 "👇👇👇👇👇" +  # 080
-                                                 "👇👇👇👇👇" +  # 090
-                                                 "👇👇👇👇👇" +  # 100
-                                                 "👇👇👇👇👇" +  # 110
-                                                 "👇👇👇👇👇" +  # 120
-                                                 "👇👇👇👇👇" +  # 130
-                                                 "👇👇1"         # 135
-                                                 ), 3)
-        self.assertEqual(Message.gsm_split_count("0123456789" +  # 010
-                                                 "0123456789" +  # 020
-                                                 "0123456789" +  # 030
-                                                 "0123456789" +  # 040
-                                                 "0123456789" +  # 050
-                                                 "0123456789" +  # 060
-                                                 "0123456789" +  # 070
-                                                 "0123456789" +  # 080
-                                                 "0123456789" +  # 090
-                                                 "0123456789" +  # 100
-                                                 "0123456789" +  # 110
-                                                 "0123456789" +  # 120
-                                                 "0123456789" +  # 130
-                                                 "0123" +        # 134
-                                                 "\uFFFF"        # 135, but non GSM
-                                                 ), 3)
+        self.assertEqual(Message.gsm_split_count(self.GSM_307), 3)
+        self.assertEqual(Message.gsm_split_count(self.UCS2_135), 3)
+        self.assertEqual(Message.gsm_split_count(self.UCS2_135_MIXED), 3)
 
     def test_init_sender(self):
-        m = Message("NoWhere", E164PhoneNumber("+491755555555"), "Hello World")
-        self.assertEqual(m.sender, "NoWhere")
-
-        m = Message("+4917111111", E164PhoneNumber("+491755555555"), "Hello World")
-        self.assertEqual(m.sender, E164PhoneNumber("+4917111111"))
-
-        m = Message(4917111111, E164PhoneNumber("+491755555555"), "Hello World")
-        self.assertEqual(m.sender, E164PhoneNumber("+4917111111"))
-
-        m = Message("+49", E164PhoneNumber("+491755555555"), "Hello World")
-        self.assertEqual(m.sender, "+49")
+        # a str in E164 notation becomes an E164PhoneNumber, any other sender is kept as given
+        for sender, expected in [
+            ("NoWhere", "NoWhere"),
+            ("+4917111111", E164PhoneNumber("+4917111111")),
+            (4917111111, E164PhoneNumber("+4917111111")),
+            ("+49", "+49"),
+        ]:
+            with self.subTest(sender=sender):
+                m = Message(sender, self.RECIPIENT, "Hello World")
+                self.assertEqual(m.sender, expected)
 
     def test_init_receiver(self):
-        m = Message("NoWhere", E164PhoneNumber("+491755555555"), "Hello World")
-        self.assertEqual(m.recipient, E164PhoneNumber("+491755555555"))
-        self.assertEqual(m.recipient.iso2, "DE")
-
-        m = Message("NoWhere", E164PhoneNumber("+491755555555", "GB"), "Hello World")
-        self.assertEqual(m.recipient.number, "+491755555555")
-        self.assertEqual(m.recipient.iso2, "GB")
-
-        m = Message("NoWhere", "+491755555555", "Hello World")
-        self.assertEqual(m.recipient, E164PhoneNumber("+491755555555"))
-        self.assertEqual(m.recipient.iso2, "DE")
-
-        m = Message("NoWhere", 491755555555, "Hello World")
-        self.assertEqual(m.recipient, E164PhoneNumber("+491755555555"))
-        self.assertEqual(m.recipient.iso2, "DE")
-
-        with self.assertRaises(ValueError):
-            Message("NoWhere", "+49", "Hello World")
-
-        with self.assertRaises(ValueError):
-            Message("NoWhere", "SomeWhere", "Hello World")
+        for recipient, expected_iso2 in [
+            (self.RECIPIENT, "DE"),
+            (E164PhoneNumber("+491755555555", "GB"), "GB"),
+            ("+491755555555", "DE"),
+            (491755555555, "DE"),
+        ]:
+            with self.subTest(recipient=recipient):
+                m = Message("NoWhere", recipient, "Hello World")
+                self.assertEqual(m.recipient.number, "+491755555555")
+                self.assertEqual(m.recipient.iso2, expected_iso2)
+
+        for recipient in ("+49", "SomeWhere"):
+            with self.subTest(recipient=recipient):
+                with self.assertRaises(ValueError):
+                    Message("NoWhere", recipient, "Hello World")
 
     def test_init(self):
-        m = Message(E164PhoneNumber("+49175444444"), E164PhoneNumber("+491755555555"), "Hello World")
+        m = Message(E164PhoneNumber("+49175444444"), self.RECIPIENT, "Hello World")
         self.assertEqual(m.sender, E164PhoneNumber("+49175444444"))
-        self.assertEqual(m.recipient, E164PhoneNumber("+491755555555"))
+        self.assertEqual(m.recipient, self.RECIPIENT)
         self.assertEqual(m.recipient.iso2, "DE")
         self.assertEqual(m.body, "Hello World")
         self.assertEqual(m.number_of_segments(), 1)
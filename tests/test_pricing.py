@@ -1,34 +1,67 @@
+import logging
+import requests
+import requests_mock
+
 from unittest import TestCase
-from unittest.mock import MagicMock, patch
 
 from decimal import Decimal, getcontext
 from dt_sms_sdk.iso2_mapper import ISO2Mapper
-from dt_sms_sdk.pricing import Currency, Price, Pricing
+from dt_sms_sdk.message import Message
+from dt_sms_sdk.pricing import Currency, Price, Pricing, _UNSUPPORTED_CURRENCY_SYMBOLS
 
 
 class DTSMSSDKPricingTest(TestCase):
 
+    # the mapping is static, so the hashed country name set is built once at class creation
+    _ISO_NAMES = frozenset(ISO2Mapper.country_name_to_ISO2_mapping)
+
+    # a single German price entry, used by all price calculation tests
+    PRICING_DE_ITEM = {"country": "Germany", "netPrice": 0.22, "grossPrice": 0.3, "vat": 0.19, "currency": "EUR"}
+
+    # 135 non GSM characters - will become 3 Messages
+    EMOJI_BODY_135 = "\U0001F447" * 67 + "1"
+
+    @classmethod
+    def setUpClass(cls):
+        # the consistency tests only read the price lists, so one download serves them all
+        cls._default = Pricing.default()
+        cls._online = Pricing.download()
+        # the price calculation tests share one Pricing and the two Messages; building the
+        # Pricing emits a warning per unmapped country, which is only asserted in test_pricing
+        logging.disable(logging.WARNING)
+        try:
+            cls._pricing_de = Pricing([cls.PRICING_DE_ITEM])
+        finally:
+            logging.disable(logging.NOTSET)
+        cls._m_de = Message("+491755555555", "+491755555556", cls.EMOJI_BODY_135)
+        cls._m_gb = Message("+441755555555", "+441755555556", cls.EMOJI_BODY_135)
+
+    def setUp(self):
+        # each download test sets up its own mock, so no cached result may leak between tests
+        Pricing.invalidate_download_cache()
+
+    def _skip_without_online_pricing_data(self):
+        if self._online is None:
+            self.skipTest('online Pricing Data is not reachable')
+
     def _test_all_pricing_data_countries_are_mapped_to_iso(self, pricing_data, pricing_data_label):
         """
         Helper Method, to tests if the country names used in pricing data are available in iso mapping.
 
         This method will be used for the offline / default and the currently online Pricing Data.
         """
-        missing_iso = 0
-        for p in pricing_data:
-            if p["country"] not in ISO2Mapper.country_name_to_ISO2_mapping.keys():
-                missing_iso += 1
-                print(f'{p["country"]} is missing in country_name_to_ISO2_mapping')
+        missing_iso = sorted({p["country"] for p in pricing_data} - self._ISO_NAMES)
 
-        self.assertEqual(missing_iso, 0,
+        self.assertEqual(missing_iso, [],
                          msg=f'{missing_iso} country names of {pricing_data_label} Pricing Data are missing in '
                              f'ISO2Mapper.country_name_to_ISO2_mapping')
 
     def test_all_default_pricing_data_countries_are_mapped_to_iso(self):
-        self._test_all_pricing_data_countries_are_mapped_to_iso(Pricing.download(), "default")
+        self._test_all_pricing_data_countries_are_mapped_to_iso(self._default, "default")
 
     def test_all_current_online_pricing_data_countries_are_mapped_to_iso(self):
-        self._test_all_pricing_data_countries_are_mapped_to_iso(Pricing.download(), "current online")
+        self._skip_without_online_pricing_data()
+        self._test_all_pricing_data_countries_are_mapped_to_iso(self._online, "current online")
 
     def _test_all_iso_are_mapped_to_pricing_data_countries(self, pricing_data, pricing_data_label):
         """
@@ -36,38 +69,27 @@ class DTSMSSDKPricingTest(TestCase):
 
         This method will be used for the offline / default and the currently online Pricing Data.
         """
-        missing_country = 0
-        countries = set()
-        for p in pricing_data:
-            countries.add(p["country"])
-
-        for c in ISO2Mapper.country_name_to_ISO2_mapping.keys():
-            if c not in countries:
-                missing_country += 1
-                print(f'{c} is missing in {pricing_data_label} Pricing Data')
+        countries = {p["country"] for p in pricing_data}
+        missing_country = sorted(self._ISO_NAMES - countries)
 
-        self.assertEqual(missing_country, 0,
+        self.assertEqual(missing_country, [],
                          msg=f'{missing_country} country names of ISO2Mapper.country_name_to_ISO2_mapping '
                              f'are missing in {pricing_data_label} Pricing Data')
 
     def test_all_iso_are_mapped_to_current_online_pricing_data_countries(self):
-        self._test_all_iso_are_mapped_to_pricing_data_countries(Pricing.download(), "current online")
+        self._skip_without_online_pricing_data()
+        self._test_all_iso_are_mapped_to_pricing_data_countries(self._online, "current online")
 
     def test_all_iso_are_mapped_to_default_pricing_data_countries(self):
-        self._test_all_iso_are_mapped_to_pricing_data_countries(Pricing.download(), "default")
+        self._test_all_iso_are_mapped_to_pricing_data_countries(self._default, "default")
 
-    @patch('dt_sms_sdk.pricing.requests.get')
-    def test_download_connection_error(self, mock_get):
-        import requests
-        mock_get.side_effect = requests.exceptions.ConnectionError()
-
-        # downloading the Pricing and get None for Connection Error
-        self.assertEqual(Pricing.download(), None)
+    def test_download_connection_error(self):
+        with requests_mock.Mocker() as mock:
+            mock.get(requests_mock.ANY, exc=requests.exceptions.ConnectionError)
+            # downloading the Pricing and get None for Connection Error
+            self.assertIsNone(Pricing.download())
 
     def test_download_header_fields(self):
-        import requests_mock
-        import requests
-
         def custom_matcher(request):
             self.assertTrue("User-Agent" in request.headers.keys())
             # "Host" is not part on this level and will automatically be added - no need to tests.
@@ -80,43 +102,27 @@ class DTSMSSDKPricingTest(TestCase):
             mock.add_matcher(custom_matcher)
             self.assertEqual(Pricing.download(), [{}])
 
-    @patch('dt_sms_sdk.pricing.requests.get')
-    def test_download_no_json_error(self, mock_get):
-        import requests
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.side_effect = requests.exceptions.JSONDecodeError("error", "\n\n", 1)
-        mock_get.return_value = mock_response
-        # downloading the Pricing and get None for JSONDecode Error
-        self.assertEqual(Pricing.download(), None)
-
-    @patch('dt_sms_sdk.pricing.requests.get')
-    def test_download_wrong_basic_json(self, mock_get):
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"key": "value"}
-
-        mock_get.return_value = mock_response
-
-        # downloading the Pricing and get None for not getting a list
-        self.assertEqual(Pricing.download(), None)
-
-    @patch('dt_sms_sdk.pricing.requests.get')
-    def test_download_right_basic_json(self, mock_get):
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [{"key": "value"}]
+    def test_download_no_json_error(self):
+        with requests_mock.Mocker() as mock:
+            mock.get(requests_mock.ANY, content=b'\n\n')
+            # downloading the Pricing and get None for JSONDecode Error
+            self.assertIsNone(Pricing.download())
 
-        mock_get.return_value = mock_response
+    def test_download_wrong_basic_json(self):
+        with requests_mock.Mocker() as mock:
+            mock.get(requests_mock.ANY, content=b'{"key": "value"}')
+            # downloading the Pricing and get None for not getting a list
+            self.assertIsNone(Pricing.download())
 
-        self.assertEqual(Pricing.download(), [{"key": "value"}])
+    def test_download_right_basic_json(self):
+        with requests_mock.Mocker() as mock:
+            mock.get(requests_mock.ANY, content=b'[{"key": "value"}]')
+            self.assertEqual(Pricing.download(), [{"key": "value"}])
 
     def test_currency(self):
-        self.assertEqual(Currency.EURO, Currency.from_str("€"))
-        self.assertEqual(Currency.EURO, Currency.from_str("₠"))
-        self.assertEqual(Currency.EURO, Currency.from_str("Euro"))
-        self.assertEqual(Currency.EURO, Currency.from_str("EUR"))
-        self.assertEqual(Currency.EURO, Currency.from_str("EURO"))
+        for label in ("€", "₠", "Euro", "EUR", "EURO"):
+            with self.subTest(label=label):
+                self.assertEqual(Currency.EURO, Currency.from_str(label))
 
     def test_currency_invalid(self):
         self.assertRaises(ValueError, Currency.from_str, None)
@@ -130,85 +136,36 @@ class DTSMSSDKPricingTest(TestCase):
         Testing all available Unicode Symbols for currencies as listed on
         https://www.compart.com/en/unicode/category/Sc
         """
-        self.assertRaises(NotImplementedError, Currency.from_str, "$")
-        self.assertRaises(NotImplementedError, Currency.from_str, "﹩")
-        self.assertRaises(NotImplementedError, Currency.from_str, "＄")
-        self.assertRaises(NotImplementedError, Currency.from_str, "¢")
-        self.assertRaises(NotImplementedError, Currency.from_str, "￠")
-        self.assertRaises(NotImplementedError, Currency.from_str, "£")
-        self.assertRaises(NotImplementedError, Currency.from_str, "￡")
-        self.assertRaises(NotImplementedError, Currency.from_str, "¤")
-        self.assertRaises(NotImplementedError, Currency.from_str, "¥")
-        self.assertRaises(NotImplementedError, Currency.from_str, "￥")
-        self.assertRaises(NotImplementedError, Currency.from_str, "֏")
-        self.assertRaises(NotImplementedError, Currency.from_str, "؋")
-        self.assertRaises(NotImplementedError, Currency.from_str, "߾")
-        self.assertRaises(NotImplementedError, Currency.from_str, "߿")
-        self.assertRaises(NotImplementedError, Currency.from_str, "৲")
-        self.assertRaises(NotImplementedError, Currency.from_str, "৳")
-        self.assertRaises(NotImplementedError, Currency.from_str, "৻")
-        self.assertRaises(NotImplementedError, Currency.from_str, "૱")
-        self.assertRaises(NotImplementedError, Currency.from_str, "௹")
-        self.assertRaises(NotImplementedError, Currency.from_str, "฿")
-        self.assertRaises(NotImplementedError, Currency.from_str, "៛")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₡")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₢")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₣")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₤")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₥")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₦")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₧")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₨")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₩")
-        self.assertRaises(NotImplementedError, Currency.from_str, "￦")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₪")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₫")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₭")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₮")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₯")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₰")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₱")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₲")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₳")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₴")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₵")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₶")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₷")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₸")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₹")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₺")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₻")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₼")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₽")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₾")
-        self.assertRaises(NotImplementedError, Currency.from_str, "₿")
-        self.assertRaises(NotImplementedError, Currency.from_str, "꠸")
-        self.assertRaises(NotImplementedError, Currency.from_str, "﷼")
-        self.assertRaises(NotImplementedError, Currency.from_str, "𑿝")
-        self.assertRaises(NotImplementedError, Currency.from_str, "𑿞")
-        self.assertRaises(NotImplementedError, Currency.from_str, "𑿟")
-        self.assertRaises(NotImplementedError, Currency.from_str, "𑿠")
-        self.assertRaises(NotImplementedError, Currency.from_str, "𞋿")
-        self.assertRaises(NotImplementedError, Currency.from_str, "𞲰")
+        # the SDK's own symbol table is the single source of truth; the count guards
+        # against the table accidentally shrinking
+        self.assertEqual(len(_UNSUPPORTED_CURRENCY_SYMBOLS), 60)
+        for sym in _UNSUPPORTED_CURRENCY_SYMBOLS:
+            with self.subTest(sym=sym), self.assertRaises(NotImplementedError):
+                Currency.from_str(sym)
 
     def test_raw_is_list(self):
-        self.assertFalse(Pricing._raw_is_list(None))
-        self.assertFalse(Pricing._raw_is_list("My Price"))
-        self.assertFalse(Pricing._raw_is_list(()))
-        self.assertFalse(Pricing._raw_is_list(("p1", "p2")))
-        self.assertFalse(Pricing._raw_is_list({}))
-        self.assertFalse(Pricing._raw_is_list({"p1": 0, "p2": 1}))
-
-        self.assertTrue(Pricing._raw_is_list([]))
-        self.assertTrue(Pricing._raw_is_list(["p1", "p2"]))
+        for raw in (None, "My Price", (), ("p1", "p2"), {}, {"p1": 0, "p2": 1}):
+            with self.subTest(raw=raw):
+                self.assertFalse(Pricing._raw_is_list(raw))
+
+        for raw in ([], ["p1", "p2"]):
+            with self.subTest(raw=raw):
+                self.assertTrue(Pricing._raw_is_list(raw))
+
+    # raw item inputs which do not resolve to an ISO2 code
+    INVALID_RAW_ISO2_ITEMS = (
+        None,
+        1,
+        "Deutschland",
+        {"Deutschland"},
+        {"country"},
+        {"country": "Wonderland"},
+    )
 
     def test_raw_item_iso2_code(self):
-        self.assertEqual(Pricing._raw_item_iso2_code(None), None)
-        self.assertEqual(Pricing._raw_item_iso2_code(1), None)
-        self.assertEqual(Pricing._raw_item_iso2_code("Deutschland"), None)
-        self.assertEqual(Pricing._raw_item_iso2_code({"Deutschland"}), None)
-        self.assertEqual(Pricing._raw_item_iso2_code({"country"}), None)
-        self.assertEqual(Pricing._raw_item_iso2_code({"country": "Wonderland"}), None)
+        for item in self.INVALID_RAW_ISO2_ITEMS:
+            with self.subTest(item=item):
+                self.assertIsNone(Pricing._raw_item_iso2_code(item))
         self.assertEqual(Pricing._raw_item_iso2_code({"country": "Germany"}), "DE")
 
     def test_price_init(self):
@@ -230,32 +187,30 @@ class DTSMSSDKPricingTest(TestCase):
         self.assertRaises(ValueError, Price, "Wonderland", 1, 1.1, "0.1", "$")  # Not yet implemented
         self.assertRaises(ValueError, Price, "Wonderland", 1, 1.1, "0.1", "?")
 
+    # raw item inputs which do not convert to a Price - each lacks a type, a key or a value
+    INVALID_RAW_PRICE_ITEMS = (
+        None,
+        1,
+        "Deutschland",
+        {"country"},
+        {"country": "Wonderland"},
+        {"country": "Germany"},
+        {"country": "Wonderland", "grossPrice": 0, "vat": 0.19, "currency": "EUR"},
+        {"country": "Wonderland", "netPrice": 0, "vat": 0.19, "currency": "EUR"},
+        {"country": "Wonderland", "netPrice": 0, "grossPrice": 0, "currency": "EUR"},
+        {"country": "Wonderland", "netPrice": 0, "grossPrice": 0, "vat": 0.19},
+    )
+
+    # expected conversion result of the one valid raw item, built once for the class
+    PRICE_ZERO_WONDERLAND = Price("Wonderland", 0, 0, 0.19, Currency.EURO)
+
     def test_raw_item_to_price(self):
-        self.assertEqual(Pricing._raw_item_to_price(None), None)
-        self.assertEqual(Pricing._raw_item_to_price(1), None)
-        self.assertEqual(Pricing._raw_item_to_price("Deutschland"), None)
-        self.assertEqual(Pricing._raw_item_to_price({"country"}), None)
-        self.assertEqual(Pricing._raw_item_to_price({"country": "Wonderland"}), None)
-        self.assertEqual(Pricing._raw_item_to_price({"country": "Germany"}), None)
-        self.assertEqual(Pricing._raw_item_to_price(
-            {"country": "Wonderland", "grossPrice": 0, "vat": 0.19, "currency": "EUR"}),
-            None
-        )
-        self.assertEqual(Pricing._raw_item_to_price(
-            {"country": "Wonderland", "netPrice": 0, "vat": 0.19, "currency": "EUR"}),
-            None
-        )
-        self.assertEqual(Pricing._raw_item_to_price(
-            {"country": "Wonderland", "netPrice": 0, "grossPrice": 0, "currency": "EUR"}),
-            None
-        )
-        self.assertEqual(Pricing._raw_item_to_price(
-            {"country": "Wonderland", "netPrice": 0, "grossPrice": 0, "vat": 0.19}),
-            None
-        )
+        for item in self.INVALID_RAW_PRICE_ITEMS:
+            with self.subTest(item=item):
+                self.assertIsNone(Pricing._raw_item_to_price(item))
         self.assertEqual(Pricing._raw_item_to_price(
             {"country": "Wonderland", "netPrice": 0, "grossPrice": 0, "vat": 0.19, "currency": "EUR"}),
-            Price("Wonderland", 0, 0, 0.19, Currency.EURO)
+            self.PRICE_ZERO_WONDERLAND
         )
 
     def test_raw_list(self):
@@ -275,40 +230,44 @@ class DTSMSSDKPricingTest(TestCase):
         checks if the default prices are still up-to-date - a new version of the SDK
         should also have a current default price list.
         """
-        default = Pricing.prices_by_iso2(Pricing.default())
-        online = Pricing.prices_by_iso2(Pricing.download())
+        self._skip_without_online_pricing_data()
+        default = Pricing.prices_by_iso2(self._default)
+        online = Pricing.prices_by_iso2(self._online)
 
-        keys = set(val for val in (list(default.keys()) + list(online.keys())))
+        # comparing canonical tuples lets one dict equality check replace the per-key loop
+        # and makes assertEqual print exactly the differing countries on failure
+        def _tup(p):
+            return p.country, p.net_price, p.gross_price, p.vat, p.currency
 
-        all_the_same = True
-        for k in keys:
-            if not default[k] == online[k]:
-                all_the_same = False
-                print(f'Default Price of {k} does not match online Price')
+        self.assertEqual({k: _tup(v) for k, v in default.items()},
+                         {k: _tup(v) for k, v in online.items()},
+                         msg='Default Prices do not match online Prices')
 
-        self.assertTrue(all_the_same)
+    # aggregated warning logged once by the Pricing constructor for all missing countries
+    _MISSING_PREFIX = "Loaded Pricing Data does not include Countries, which are part of country name mapping:"
 
     def test_pricing(self):
         with self.assertLogs() as captured:
             p = Pricing([{"country": "Germany", "netPrice": 0.22, "grossPrice": 0.3, "vat": 0.19, "currency": "EUR"}])
-        self.assertEqual(len(captured.records), len(ISO2Mapper.country_name_to_ISO2_mapping)-1)
-        for i in range(len(ISO2Mapper.country_name_to_ISO2_mapping)-1):
-            self.assertEqual(captured.records[i].getMessage()[:-3],
-                             "Loaded Pricing Data does not include Country, which is part of country name mapping:"
-                             )
+        self.assertEqual(len(captured.records), 1)
+        # startswith compares in place, without slicing a new string per record
+        self.assertTrue(captured.records[0].getMessage().startswith(self._MISSING_PREFIX),
+                        msg=captured.records[0].getMessage())
+        # all mapped countries except the loaded one must be listed in the aggregated record
+        self.assertEqual(captured.records[0].getMessage().count(','),
+                         len(ISO2Mapper.country_name_to_ISO2_mapping) - 2 + 1)
 
         with self.assertLogs() as captured:
             p = Pricing([{"country": "Wonderland", "netPrice": 0.2, "grossPrice": 0.3, "vat": 0.19, "currency": "EUR"}])
-        self.assertEqual(len(captured.records), len(ISO2Mapper.country_name_to_ISO2_mapping)+2)
+        self.assertEqual(len(captured.records), 3)
         self.assertEqual(captured.records[0].getMessage(), "No ISO2 mapping for Wonderland in Pricing data found.")
         self.assertEqual(captured.records[1].getMessage(), "Not all entries of Pricing data could be correctly loaded!")
-        for i in range(len(ISO2Mapper.country_name_to_ISO2_mapping)):
-            self.assertEqual(captured.records[i+2].getMessage()[:-3],
-                             "Loaded Pricing Data does not include Country, which is part of country name mapping:"
-                             )
+        self.assertTrue(captured.records[2].getMessage().startswith(self._MISSING_PREFIX),
+                        msg=captured.records[2].getMessage())
 
     def test_xxx_price_by_iso2(self):
-        p = Pricing([{"country": "Germany", "netPrice": 0.22, "grossPrice": 0.3, "vat": 0.19, "currency": "EUR"}])
+        # reuses the Pricing built quietly in setUpClass, so no warning records are emitted here
+        p = self._pricing_de
         self.assertEqual(p.net_price_by_iso2("DE"), Decimal("0.22"))
         self.assertEqual(p.gross_price_by_iso2("DE"), Decimal("0.3"))
 
@@ -319,6 +278,7 @@ class DTSMSSDKPricingTest(TestCase):
         self.assertEqual(captured.records[0].getMessage(), "No Price Data for ISO2 Code: GB")
         self.assertEqual(captured.records[1].getMessage(), "No Price Data for ISO2 Code: GB")
 
+        self.addCleanup(setattr, p, "price_data", p.price_data)
         p.price_data = "Invalid"
         with self.assertLogs() as captured:
             self.assertTrue(p.net_price_by_iso2("GB").is_nan())
@@ -329,46 +289,13 @@ class DTSMSSDKPricingTest(TestCase):
 
 
     def test_message_xxx_price(self):
-        from dt_sms_sdk.message import Message
-        p = Pricing([{"country": "Germany", "netPrice": 0.22, "grossPrice": 0.3, "vat": 0.19, "currency": "EUR"}])
-        m = Message("+491755555555", "+491755555556",
-                    "👇👇👇👇👇" +  # 010
-                    "👇👇👇👇👇" +  # 020
-                    "👇👇👇👇👇" +  # 030
-                    "👇👇👇👇👇" +  # 040
-                    "👇👇👇👇👇" +  # 050
-                    "👇👇👇👇👇" +  # 060
-                    "👇👇👇👇👇" +  # 070
-                    "👇👇👇👇👇" +  # 080
-                    "👇👇👇👇👇" +  # 090
-                    "👇👇👇👇👇" +  # 100
-                    "👇👇👇👇👇" +  # 110
-                    "👇👇👇👇👇" +  # 120
-                    "👇👇👇👇👇" +  # 130
-                    "👇👇1"  # 135
-                    # will become 3 Messages
-                    )
+        p = self._pricing_de
+        m = self._m_de
         self.assertEqual(p.message_net_price(m), Decimal("0.66"))
         self.assertEqual(p.message_gross_price(m), Decimal("0.9"))
 
         # GB Number
-        m = Message("+441755555555", "+441755555556",
-                    "👇👇👇👇👇" +  # 010
-                    "👇👇👇👇👇" +  # 020
-                    "👇👇👇👇👇" +  # 030
-                    "👇👇👇👇👇" +  # 040
-                    "👇👇👇👇👇" +  # 050
-                    "👇👇👇👇👇" +  # 060
-                    "👇👇👇👇👇" +  # 070
-                    "👇👇👇👇👇" +  # 080
-                    "👇👇👇👇👇" +  # 090
-                    "👇👇👇👇👇" +  # 100
-                    "👇👇👇👇👇" +  # 110
-                    "👇👇👇👇👇" +  # 120
-                    "👇👇👇👇👇" +  # 130
-                    "👇👇1"  # 135
-                    # will become 3 Messages
-                    )
+        m = self._m_gb
         with self.assertLogs() as captured:
             self.assertTrue(p.message_net_price(m).is_nan())
             self.assertTrue(p.message_gross_price(m).is_nan())
@@ -376,6 +303,7 @@ class DTSMSSDKPricingTest(TestCase):
         self.assertEqual(captured.records[0].getMessage(), "No Price Data for ISO2 Code: GB")
         self.assertEqual(captured.records[1].getMessage(), "No Price Data for ISO2 Code: GB")
 
+        self.addCleanup(setattr, p, "price_data", p.price_data)
         p.price_data = "Invalid"
         with self.assertLogs() as captured:
             self.assertTrue(p.message_net_price(m).is_nan())
@@ -385,42 +313,9 @@ class DTSMSSDKPricingTest(TestCase):
         self.assertEqual(captured.records[1].getMessage(), "Price Data stored in Pricing is not a dictionary.")
 
     def test_messages_gross_price(self):
-        from dt_sms_sdk.message import Message
-        p = Pricing([{"country": "Germany", "netPrice": 0.22, "grossPrice": 0.3, "vat": 0.19, "currency": "EUR"}])
-        m = Message("+491755555555", "+491755555556",
-                    "👇👇👇👇👇" +  # 010
-                    "👇👇👇👇👇" +  # 020
-                    "👇👇👇👇👇" +  # 030
-                    "👇👇👇👇👇" +  # 040
-                    "👇👇👇👇👇" +  # 050
-                    "👇👇👇👇👇" +  # 060
-                    "👇👇👇👇👇" +  # 070
-                    "👇👇👇👇👇" +  # 080
-                    "👇👇👇👇👇" +  # 090
-                    "👇👇👇👇👇" +  # 100
-                    "👇👇👇👇👇" +  # 110
-                    "👇👇👇👇👇" +  # 120
-                    "👇👇👇👇👇" +  # 130
-                    "👇👇1"  # 135
-                    # will become 3 Messages
-                    )
-        n = Message("+441755555555", "+441755555556",
-                    "👇👇👇👇👇" +  # 010
-                    "👇👇👇👇👇" +  # 020
-                    "👇👇👇👇👇" +  # 030
-                    "👇👇👇👇👇" +  # 040
-                    "👇👇👇👇👇" +  # 050
-                    "👇👇👇👇👇" +  # 060
-                    "👇👇👇👇👇" +  # 070
-                    "👇👇👇👇👇" +  # 080
-                    "👇👇👇👇👇" +  # 090
-                    "👇👇👇👇👇" +  # 100
-                    "👇👇👇👇👇" +  # 110
-                    "👇👇👇👇👇" +  # 120
-                    "👇👇👇👇👇" +  # 130
-                    "👇👇1"  # 135
-                    # will become 3 Messages
-                    )
+        p = self._pricing_de
+        m = self._m_de
+        n = self._m_gb
 
         self.assertEqual(p.messages_net_price([m, m, m]), Decimal("0.66") * 3)
         self.assertEqual(p.messages_net_price([m, m, "Something"]), Decimal("0.66") * 2)
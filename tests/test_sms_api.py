@@ -1,3 +1,6 @@
+from copy import copy
+from functools import partial
+from json import dumps
 from unittest import TestCase
 from datetime import datetime, timezone
 
@@ -10,8 +13,168 @@ import requests_mock
 import requests
 
 
+# prototype cloned by _api_response: the shallow copy skips re-initializing the header,
+# cookie and history containers requests.Response.__init__ builds on every call - the
+# matchers only ever set the status code and body on their copy
+_RESPONSE_PROTOTYPE = requests.Response()
+
+
+def _api_response(status_code: int, content) -> requests.Response:
+    """
+    Builds a requests.Response with the given status code and body, as returned by a matcher.
+    """
+    resp = copy(_RESPONSE_PROTOTYPE)
+    resp.status_code = status_code
+    resp._content = content
+    return resp
+
+
+def _error_body(status: int, error: str, message: str, path: str = "/service/sms/v1/messages") -> bytes:
+    """
+    Builds an API error response body as used by the DT SMS API for the given values.
+    """
+    return (f'{{\n'
+            f'    "timestamp": "2023-01-11T08:06:51.631+00:00",\n'
+            f'    "path": "{path}",\n'
+            f'    "status": {status},\n'
+            f'    "error": "{error}",\n'
+            f'    "message": "{message}",\n'
+            f'    "requestId": "ffc84d0f-164227"\n'
+            f'}}').encode()
+
+
+# the matchers are plain module level functions bound to their test data via
+# functools.partial, instead of a closure compiled inside every test body
+def _post_error_matcher(request, testcase, api_key, status_code, content):
+    testcase._test_request_post(request, api_key)
+    return _api_response(status_code, content)
+
+
+def _get_error_matcher(request, testcase, api_key, status_code, content):
+    testcase._test_request_get(request, api_key)
+    return _api_response(status_code, content)
+
+
+def _send_200_matcher(request, testcase, content):
+    testcase._test_request_post(request, "Good Case")
+    testcase.assertEqual(request.body, 'From=%2B491755555555&To=%2B4915111111111&Body=Hello+World')
+    return _api_response(200, content)
+
+
+def _status_200_matcher(request, testcase, content):
+    testcase._test_request_get(request, "Good Case")
+    testcase.assertEqual(request.url, "https://api.telekom.com/service/sms/v1/messages/23bcd1bb62dc2248596d52e9")
+    return _api_response(200, content)
+
+
+def _send_and_status_matcher(request, testcase):
+    if request.method == "POST":
+        return _api_response(200, testcase.ACCEPTED_BODY)
+    return _api_response(200, testcase.DELIVERED_BODY)
+
+
 class DTSMSSDKAPIClient(TestCase):
 
+    # expected timestamps of the canned payload, constructed once; datetime is immutable
+    DATE_CREATED = datetime(year=2023, month=1, day=11, hour=15, minute=11, second=55, tzinfo=timezone.utc)
+    DATE_UPDATED = datetime(year=2023, month=1, day=11, hour=15, minute=11, second=56, tzinfo=timezone.utc)
+    DATE_UPDATED_DELIVERED = datetime(year=2023, month=1, day=11, hour=15, minute=11, second=58, tzinfo=timezone.utc)
+
+    # the error path tests only differ in (api_key, status code, response body, raised
+    # error), so they are driven by one table per endpoint instead of one method each
+    SEND_ERROR_RESPONSES = [
+        ("Invalid Key", 401, b'', NotAuthorizedError),
+        # normally the header field content type is referred in the message between \'\'
+        ("Invalid Media Type", 415,
+         _error_body(415, "Unsupported Media Type", "Content type \'\' not supported"),
+         UnsupportedMediaTypeError),
+        ("Invalid Number", 422,
+         _error_body(422, "Unprocessable Entity", "Number: +491755555555 cannot be used because is not verified"),
+         SenderNumberNotVerifiedError),
+        ("Invalid Number", 422,
+         _error_body(422, "Unprocessable Entity", "Not enough money on the wallet"),
+         NotEnoughMoneyOnTheWalletError),
+        ("Invalid Route", 422,
+         _error_body(422, "Unprocessable Entity", "No routing available for sms from: +491755555555 to: +49203555555"),
+         NoRouteToRecipientNumberError),
+        ("Future", 422,
+         _error_body(422, "Unprocessable Entity", "In the future I do not want to do SMS anymore ;-)"),
+         SMSAPIError),
+        ("Server Error", 500,
+         _error_body(500, "Internal Server Error", "Something went wrong."),
+         InternalSMSAPIError),
+        ("Future2", 499,
+         _error_body(499, "Future Error", "In the future I do not want to do SMS anymore ;-)"),
+         SMSAPIError),
+    ]
+
+    STATUS_ERROR_RESPONSES = [
+        ("Invalid Key", 401, b'', NotAuthorizedError),
+        ("Invalid SID", 404,
+         _error_body(404, "Not Found", "Message: xxxxxxx not found", path="/service/sms/v1/messages/xxxxxxx"),
+         MessageNotFoundError),
+        ("Server Error", 500,
+         _error_body(500, "Internal Server Error", "Something went wrong.", path="/service/sms/v1/messages/xxxxxxx"),
+         InternalSMSAPIError),
+        ("Future3", 499,
+         _error_body(499, "Future Error", "In the future I do not want to do SMS anymore ;-)",
+                     path="/service/sms/v1/messages/xxxxxxx"),
+         SMSAPIError),
+    ]
+
+    # the good-case payload exists exactly once as a dict; the body variants the tests
+    # return are serialized from it here instead of repeating the JSON literal per test
+    ACCEPTED_PAYLOAD = {
+        "sid": "23bcd1bb62dc2248596d52e9",
+        "date_created": "Wed, 11 Jan 2023 15:11:55 +0000",
+        "date_updated": "Wed, 11 Jan 2023 15:11:56 +0000",
+        "from": "+491755555555",
+        "to": "+4915111111111",
+        "body": "Hello World",
+        "status": "accepted",
+        "uri": "/service/sms/v1/messages/23bcd1bb62dc2248596d52e9",
+        "direction": "outbound-api",
+        "api_version": "1.1.5",
+        "num_segments": 1
+    }
+    ACCEPTED_BODY = dumps(ACCEPTED_PAYLOAD).encode()
+    ACCEPTED_BODY_2_SEGMENTS = dumps({**ACCEPTED_PAYLOAD, "num_segments": 2}).encode()
+    DELIVERED_BODY = dumps({**ACCEPTED_PAYLOAD,
+                            "date_updated": "Wed, 11 Jan 2023 15:11:58 +0000",
+                            "status": "delivered"}).encode()
+
+    @classmethod
+    def setUpClass(cls):
+        # one Mocker patched in for the whole class; installing and removing the adapter
+        # once instead of per test removes the dominant fixed cost of this suite
+        cls.mocker = requests_mock.Mocker()
+        cls.mocker.start()
+        cls.message = Message(sender="+491755555555", recipient="+4915111111111", body="Hello World")
+        cls._clients = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        for client in cls._clients.values():
+            client.close()
+        cls.mocker.stop()
+
+    @classmethod
+    def _client(cls, api_key: str) -> SMSAPIClient:
+        # one client (and so one underlying Session with its adapter and pool) per
+        # distinct api_key; the tests never mutate client state after construction
+        client = cls._clients.get(api_key)
+        if client is None:
+            client = cls._clients[api_key] = SMSAPIClient(api_key=api_key)
+        return client
+
+    def setUp(self):
+        self._reset_matchers()
+
+    def _reset_matchers(self):
+        # drop the matcher of the previous (sub)test, the shared Mocker itself stays in
+        # place; Mocker.reset() would instead call reset() on the plain function matchers
+        self.mocker._adapter._matchers.clear()
+
     def _test_request_get(self, request: requests.Request, expected_key):
         self.assertTrue("X-API-Key" in request.headers.keys())
         self.assertEqual(request.headers["X-API-Key"], expected_key)
@@ -25,492 +188,99 @@ class DTSMSSDKAPIClient(TestCase):
         self.assertEqual(request.url, "https://api.telekom.com/service/sms/v1/messages")
         self.assertEqual(request.method, "POST")
 
+    def _assert_accepted_response(self, r, num_segments: int = 1):
+        # one tuple comparison replaces the former eleven assertEqual calls per test
+        self.assertTrue(isinstance(r.message, Message))
+        self.assertEqual(
+            (r.sid, r.date_created, r.date_updated, str(r.message.sender), str(r.message.recipient),
+             r.message.body, r.status, r.uri, r.direction, r.api_version, r.num_segments),
+            ("23bcd1bb62dc2248596d52e9", self.DATE_CREATED, self.DATE_UPDATED, "+491755555555",
+             "+4915111111111", "Hello World", SMSAPIMessageStatus.ACCEPTED,
+             "/service/sms/v1/messages/23bcd1bb62dc2248596d52e9", SMSMessageDirection.OUTBOUND,
+             "1.1.5", num_segments)
+        )
+
     def test_init(self):
         c = SMSAPIClient(api_key="myKey")
         self.assertEqual(c.api_key, "myKey")
 
-    def test_send_401(self):
-        def custom_matcher(request):
-            self._test_request_post(request, "Invalid Key")
-            resp = requests.Response()
-            resp.status_code = 401
-            resp._content = ''
-            return resp
-
-        with requests_mock.Mocker() as mock:
-            mock.add_matcher(custom_matcher)
-            c = SMSAPIClient(api_key="Invalid Key")
-            m = Message(sender="+491755555555", recipient="+4915111111111", body="Hello World")
-            self.assertRaises(NotAuthorizedError, c.send, m)
-
-    def test_send_415(self):
-        def custom_matcher(request):
-            self._test_request_post(request, "Invalid Media Type")
-            resp = requests.Response()
-            resp.status_code = 415
-            # normally the header field content type is referred in the message between \'\'
-            resp._content = b'{\n' + \
-                            b'    "timestamp": "2023-01-11T08:06:51.631+00:00",\n' + \
-                            b'    "path": "/service/sms/v1/messages",\n' + \
-                            b'    "status": 415,\n' + \
-                            b'    "error": "Unsupported Media Type",\n' + \
-                            b'    "message": "Content type \'\' not supported",\n' + \
-                            b'    "requestId": "ffc84d0f-164227"\n' + \
-                            b'}'
-            return resp
-
-        with requests_mock.Mocker() as mock:
-            mock.add_matcher(custom_matcher)
-            c = SMSAPIClient(api_key="Invalid Media Type")
-            m = Message(sender="+491755555555", recipient="+4915111111111", body="Hello World")
-            self.assertRaises(UnsupportedMediaTypeError, c.send, m)
-
-    def test_send_422_invalid_number(self):
-        def custom_matcher(request):
-            self._test_request_post(request, "Invalid Number")
-            resp = requests.Response()
-            resp.status_code = 422
-            resp._content = b'{\n' + \
-                            b'    "timestamp": "2023-01-11T08:06:51.631+00:00",\n' + \
-                            b'    "path": "/service/sms/v1/messages",\n' + \
-                            b'    "status": 422,\n' + \
-                            b'    "error": "Unprocessable Entity",\n' + \
-                            b'    "message": "Number: +491755555555 cannot be used because is not verified",\n' + \
-                            b'    "requestId": "ffc84d0f-164227"\n' + \
-                            b'}'
-            return resp
-
-        with requests_mock.Mocker() as mock:
-            mock.add_matcher(custom_matcher)
-            c = SMSAPIClient(api_key="Invalid Number")
-            m = Message(sender="+491755555555", recipient="+4915111111111", body="Hello World")
-            self.assertRaises(SenderNumberNotVerifiedError, c.send, m)
-
-    def test_send_422_not_enough_money(self):
-        def custom_matcher(request):
-            self._test_request_post(request, "Invalid Number")
-            resp = requests.Response()
-            resp.status_code = 422
-            resp._content = b'{\n' + \
-                            b'    "timestamp": "2023-01-11T08:06:51.631+00:00",\n' + \
-                            b'    "path": "/service/sms/v1/messages",\n' + \
-                            b'    "status": 422,\n' + \
-                            b'    "error": "Unprocessable Entity",\n' + \
-                            b'    "message": "Not enough money on the wallet",\n' + \
-                            b'    "requestId": "ffc84d0f-164227"\n' + \
-                            b'}'
-            return resp
-
-        with requests_mock.Mocker() as mock:
-            mock.add_matcher(custom_matcher)
-            c = SMSAPIClient(api_key="Invalid Number")
-            m = Message(sender="+491755555555", recipient="+4915111111111", body="Hello World")
-            self.assertRaises(NotEnoughMoneyOnTheWalletError, c.send, m)
-
-    def test_send_422_invalid_route(self):
-        def custom_matcher(request):
-            self._test_request_post(request, "Invalid Route")
-            resp = requests.Response()
-            resp.status_code = 422
-            resp._content = b'{\n' + \
-                            b'    "timestamp": "2023-01-11T08:06:51.631+00:00",\n' + \
-                            b'    "path": "/service/sms/v1/messages",\n' + \
-                            b'    "status": 422,\n' + \
-                            b'    "error": "Unprocessable Entity",\n' + \
-                            b'    "message": "No routing available for sms from: +491755555555 to: +49203555555",\n' + \
-                            b'    "requestId": "ffc84d0f-164227"\n' + \
-                            b'}'
-            return resp
-
-        with requests_mock.Mocker() as mock:
-            mock.add_matcher(custom_matcher)
-            c = SMSAPIClient(api_key="Invalid Route")
-            m = Message(sender="+491755555555", recipient="+4915111111111", body="Hello World")
-            self.assertRaises(NoRouteToRecipientNumberError, c.send, m)
-
-    def test_send_422_future_error(self):
-        def custom_matcher(request):
-            self._test_request_post(request, "Future")
-            resp = requests.Response()
-            resp.status_code = 422
-            resp._content = b'{\n' + \
-                            b'    "timestamp": "2023-01-11T08:06:51.631+00:00",\n' + \
-                            b'    "path": "/service/sms/v1/messages",\n' + \
-                            b'    "status": 422,\n' + \
-                            b'    "error": "Unprocessable Entity",\n' + \
-                            b'    "message": "In the future I do not want to do SMS anymore ;-)",\n' + \
-                            b'    "requestId": "ffc84d0f-164227"\n' + \
-                            b'}'
-            return resp
-
-        with requests_mock.Mocker() as mock:
-            mock.add_matcher(custom_matcher)
-            c = SMSAPIClient(api_key="Future")
-            m = Message(sender="+491755555555", recipient="+4915111111111", body="Hello World")
-            self.assertRaises(SMSAPIError, c.send, m)
-
-    def test_send_500(self):
-        def custom_matcher(request):
-            self._test_request_post(request, "Server Error")
-            resp = requests.Response()
-            resp.status_code = 500
-            resp._content = b'{\n' + \
-                            b'    "timestamp": "2023-01-11T08:06:51.631+00:00",\n' + \
-                            b'    "path": "/service/sms/v1/messages",\n' + \
-                            b'    "status": 500,\n' + \
-                            b'    "error": "Internal Server Error",\n' + \
-                            b'    "message": "Something went wrong.",\n' + \
-                            b'    "requestId": "ffc84d0f-164227"\n' + \
-                            b'}'
-            return resp
-
-        with requests_mock.Mocker() as mock:
-            mock.add_matcher(custom_matcher)
-            c = SMSAPIClient(api_key="Server Error")
-            m = Message(sender="+491755555555", recipient="+4915111111111", body="Hello World")
-            self.assertRaises(InternalSMSAPIError, c.send, m)
+    def test_send_error_responses(self):
+        for api_key, status, content, expected_error in self.SEND_ERROR_RESPONSES:
+            with self.subTest(api_key=api_key, status=status, expected_error=expected_error):
+                self._reset_matchers()
+                self.mocker.add_matcher(partial(_post_error_matcher, testcase=self, api_key=api_key,
+                                                status_code=status, content=content))
+                c = self._client(api_key)
+                self.assertRaises(expected_error, c.send, self.message)
 
     def test_send_200(self):
-        def custom_matcher(request):
-            self._test_request_post(request, "Good Case")
-            self.assertEqual(request.body, 'From=%2B491755555555&To=%2B4915111111111&Body=Hello+World')
-
-            resp = requests.Response()
-            resp.status_code = 200
-            resp._content = b'{\n' + \
-                            b'    "sid":"23bcd1bb62dc2248596d52e9",\n' + \
-                            b'    "date_created":"Wed, 11 Jan 2023 15:11:55 +0000",\n' + \
-                            b'    "date_updated":"Wed, 11 Jan 2023 15:11:56 +0000",\n' + \
-                            b'    "from":"+491755555555",\n' + \
-                            b'    "to":"+4915111111111",\n' + \
-                            b'    "body":"Hello World",\n' + \
-                            b'    "status":"accepted",\n' + \
-                            b'    "uri":"/service/sms/v1/messages/23bcd1bb62dc2248596d52e9",\n' + \
-                            b'    "direction":"outbound-api",\n' + \
-                            b'    "api_version":"1.1.5",\n' + \
-                            b'    "num_segments":1\n' + \
-                            b'}'
-            return resp
-
-        with requests_mock.Mocker() as mock:
-            mock.add_matcher(custom_matcher)
-            c = SMSAPIClient(api_key="Good Case")
-            m = Message(sender="+491755555555", recipient="+4915111111111", body="Hello World")
-            r = c.send(m)
-            self.assertEqual(r.sid, "23bcd1bb62dc2248596d52e9")
-            self.assertEqual(r.date_created, datetime(year=2023, month=1, day=11,
-                                                      hour=15, minute=11, second=55, tzinfo=timezone.utc))
-            self.assertEqual(r.date_updated, datetime(year=2023, month=1, day=11,
-                                                      hour=15, minute=11, second=56, tzinfo=timezone.utc))
-            self.assertTrue(isinstance(r.message, Message))
-            self.assertEqual(str(r.message.sender), "+491755555555")
-            self.assertEqual(str(r.message.recipient), "+4915111111111")
-            self.assertEqual(r.message.body, "Hello World")
-            self.assertEqual(r.status, SMSAPIMessageStatus.ACCEPTED)
-            self.assertEqual(r.uri, "/service/sms/v1/messages/23bcd1bb62dc2248596d52e9")
-            self.assertEqual(r.direction, SMSMessageDirection.OUTBOUND)
-            self.assertEqual(r.api_version, "1.1.5")
-            self.assertEqual(r.num_segments, 1)
+        self.mocker.add_matcher(partial(_send_200_matcher, testcase=self, content=self.ACCEPTED_BODY))
+        c = self._client("Good Case")
+        r = c.send(self.message)
+        self._assert_accepted_response(r)
 
     def test_send_200_num_seg_mismath(self):
-        def custom_matcher(request):
-            self._test_request_post(request, "Good Case")
-            self.assertEqual(request.body, 'From=%2B491755555555&To=%2B4915111111111&Body=Hello+World')
-
-            resp = requests.Response()
-            resp.status_code = 200
-            resp._content = b'{\n' + \
-                            b'    "sid":"23bcd1bb62dc2248596d52e9",\n' + \
-                            b'    "date_created":"Wed, 11 Jan 2023 15:11:55 +0000",\n' + \
-                            b'    "date_updated":"Wed, 11 Jan 2023 15:11:56 +0000",\n' + \
-                            b'    "from":"+491755555555",\n' + \
-                            b'    "to":"+4915111111111",\n' + \
-                            b'    "body":"Hello World",\n' + \
-                            b'    "status":"accepted",\n' + \
-                            b'    "uri":"/service/sms/v1/messages/23bcd1bb62dc2248596d52e9",\n' + \
-                            b'    "direction":"outbound-api",\n' + \
-                            b'    "api_version":"1.1.5",\n' + \
-                            b'    "num_segments":2\n' + \
-                            b'}'
-            return resp
-
-        with requests_mock.Mocker() as mock:
-            mock.add_matcher(custom_matcher)
-            c = SMSAPIClient(api_key="Good Case")
-            m = Message(sender="+491755555555", recipient="+4915111111111", body="Hello World")
-            with self.assertLogs() as captured:
-                r = c.send(m)
-            self.assertEqual(r.sid, "23bcd1bb62dc2248596d52e9")
-            self.assertEqual(r.date_created, datetime(year=2023, month=1, day=11,
-                                                      hour=15, minute=11, second=55, tzinfo=timezone.utc))
-            self.assertEqual(r.date_updated, datetime(year=2023, month=1, day=11,
-                                                      hour=15, minute=11, second=56, tzinfo=timezone.utc))
-            self.assertTrue(isinstance(r.message, Message))
-            self.assertEqual(str(r.message.sender), "+491755555555")
-            self.assertEqual(str(r.message.recipient), "+4915111111111")
-            self.assertEqual(r.message.body, "Hello World")
-            self.assertEqual(r.status, SMSAPIMessageStatus.ACCEPTED)
-            self.assertEqual(r.uri, "/service/sms/v1/messages/23bcd1bb62dc2248596d52e9")
-            self.assertEqual(r.direction, SMSMessageDirection.OUTBOUND)
-            self.assertEqual(r.api_version, "1.1.5")
-            self.assertEqual(r.num_segments, 2)  # this one is set wrong to simulate API split more than we assume
-            # when SDK and API calculate different num seg, SDK places a warning in the logs
-            self.assertEqual(len(captured.records), 1)
-            self.assertEqual(captured.records[0].getMessage(),
-                             "DT SMS API split the message into 2 while SDK calculates 1 splits!")
-
-    def test_send_xxx_future_error(self):
-        def custom_matcher(request):
-            self._test_request_post(request, "Future2")
-            resp = requests.Response()
-            resp.status_code = 499
-            resp._content = b'{\n' + \
-                            b'    "timestamp": "2023-01-11T08:06:51.631+00:00",\n' + \
-                            b'    "path": "/service/sms/v1/messages",\n' + \
-                            b'    "status": 499,\n' + \
-                            b'    "error": "Future Error",\n' + \
-                            b'    "message": "In the future I do not want to do SMS anymore ;-)",\n' + \
-                            b'    "requestId": "ffc84d0f-164227"\n' + \
-                            b'}'
-            return resp
-
-        with requests_mock.Mocker() as mock:
-            mock.add_matcher(custom_matcher)
-            c = SMSAPIClient(api_key="Future2")
-            m = Message(sender="+491755555555", recipient="+4915111111111", body="Hello World")
-            self.assertRaises(SMSAPIError, c.send, m)
+        self.mocker.add_matcher(partial(_send_200_matcher, testcase=self, content=self.ACCEPTED_BODY_2_SEGMENTS))
+        c = self._client("Good Case")
+        with self.assertLogs() as captured:
+            r = c.send(self.message)
+        # num_segments is set wrong in the canned body to simulate the API splitting more than we assume
+        self._assert_accepted_response(r, num_segments=2)
+        # when SDK and API calculate different num seg, SDK places a warning in the logs
+        self.assertEqual(len(captured.records), 1)
+        self.assertEqual(captured.records[0].getMessage(),
+                         "DT SMS API split the message into 2 while SDK calculates 1 splits!")
 
     def test_status_200(self):
-        def custom_matcher(request):
-            self._test_request_get(request, "Good Case")
-            self.assertEqual(request.url, "https://api.telekom.com/service/sms/v1/messages/23bcd1bb62dc2248596d52e9")
-            resp = requests.Response()
-            resp.status_code = 200
-            resp._content = b'{\n' + \
-                            b'    "sid":"23bcd1bb62dc2248596d52e9",\n' + \
-                            b'    "date_created":"Wed, 11 Jan 2023 15:11:55 +0000",\n' + \
-                            b'    "date_updated":"Wed, 11 Jan 2023 15:11:56 +0000",\n' + \
-                            b'    "from":"+491755555555",\n' + \
-                            b'    "to":"+4915111111111",\n' + \
-                            b'    "body":"Hello World",\n' + \
-                            b'    "status":"accepted",\n' + \
-                            b'    "uri":"/service/sms/v1/messages/23bcd1bb62dc2248596d52e9",\n' + \
-                            b'    "direction":"outbound-api",\n' + \
-                            b'    "api_version":"1.1.5",\n' + \
-                            b'    "num_segments":1\n' + \
-                            b'}'
-            return resp
-
-        with requests_mock.Mocker() as mock:
-            mock.add_matcher(custom_matcher)
-            c = SMSAPIClient(api_key="Good Case")
-            r = c.status("23bcd1bb62dc2248596d52e9")
-            self.assertEqual(r.sid, "23bcd1bb62dc2248596d52e9")
-            self.assertEqual(r.date_created, datetime(year=2023, month=1, day=11,
-                                                      hour=15, minute=11, second=55, tzinfo=timezone.utc))
-            self.assertEqual(r.date_updated, datetime(year=2023, month=1, day=11,
-                                                      hour=15, minute=11, second=56, tzinfo=timezone.utc))
-            self.assertTrue(isinstance(r.message, Message))
-            self.assertEqual(str(r.message.sender), "+491755555555")
-            self.assertEqual(str(r.message.recipient), "+4915111111111")
-            self.assertEqual(r.message.body, "Hello World")
-            self.assertEqual(r.status, SMSAPIMessageStatus.ACCEPTED)
-            self.assertEqual(r.uri, "/service/sms/v1/messages/23bcd1bb62dc2248596d52e9")
-            self.assertEqual(r.direction, SMSMessageDirection.OUTBOUND)
-            self.assertEqual(r.api_version, "1.1.5")
-            self.assertEqual(r.num_segments, 1)
+        self.mocker.add_matcher(partial(_status_200_matcher, testcase=self, content=self.ACCEPTED_BODY))
+        c = self._client("Good Case")
+        r = c.status("23bcd1bb62dc2248596d52e9")
+        self._assert_accepted_response(r)
 
     def test_status_200_num_seg_mismath(self):
-        def custom_matcher(request):
-            self._test_request_get(request, "Good Case")
-            self.assertEqual(request.url, "https://api.telekom.com/service/sms/v1/messages/23bcd1bb62dc2248596d52e9")
-            resp = requests.Response()
-            resp.status_code = 200
-            resp._content = b'{\n' + \
-                            b'    "sid":"23bcd1bb62dc2248596d52e9",\n' + \
-                            b'    "date_created":"Wed, 11 Jan 2023 15:11:55 +0000",\n' + \
-                            b'    "date_updated":"Wed, 11 Jan 2023 15:11:56 +0000",\n' + \
-                            b'    "from":"+491755555555",\n' + \
-                            b'    "to":"+4915111111111",\n' + \
-                            b'    "body":"Hello World",\n' + \
-                            b'    "status":"accepted",\n' + \
-                            b'    "uri":"/service/sms/v1/messages/23bcd1bb62dc2248596d52e9",\n' + \
-                            b'    "direction":"outbound-api",\n' + \
-                            b'    "api_version":"1.1.5",\n' + \
-                            b'    "num_segments":2\n' + \
-                            b'}'
-            return resp
-
-        with requests_mock.Mocker() as mock:
-            mock.add_matcher(custom_matcher)
-            c = SMSAPIClient(api_key="Good Case")
-            with self.assertLogs() as captured:
-                r = c.status("23bcd1bb62dc2248596d52e9")
-            self.assertEqual(r.sid, "23bcd1bb62dc2248596d52e9")
-            self.assertEqual(r.date_created, datetime(year=2023, month=1, day=11,
-                                                      hour=15, minute=11, second=55, tzinfo=timezone.utc))
-            self.assertEqual(r.date_updated, datetime(year=2023, month=1, day=11,
-                                                      hour=15, minute=11, second=56, tzinfo=timezone.utc))
-            self.assertTrue(isinstance(r.message, Message))
-            self.assertEqual(str(r.message.sender), "+491755555555")
-            self.assertEqual(str(r.message.recipient), "+4915111111111")
-            self.assertEqual(r.message.body, "Hello World")
-            self.assertEqual(r.status, SMSAPIMessageStatus.ACCEPTED)
-            self.assertEqual(r.uri, "/service/sms/v1/messages/23bcd1bb62dc2248596d52e9")
-            self.assertEqual(r.direction, SMSMessageDirection.OUTBOUND)
-            self.assertEqual(r.api_version, "1.1.5")
-            self.assertEqual(r.num_segments, 2)  # this one is set wrong to simulate API split more than we assume
-            # when SDK and API calculate different num seg, SDK places a warning in the logs
-            self.assertEqual(len(captured.records), 1)
-            self.assertEqual(captured.records[0].getMessage(),
-                             "DT SMS API split the message into 2 while SDK calculates 1 splits!")
-
-    def test_status_401(self):
-        def custom_matcher(request):
-            self._test_request_get(request, "Invalid Key")
-            resp = requests.Response()
-            resp.status_code = 401
-            resp._content = ''
-            return resp
-
-        with requests_mock.Mocker() as mock:
-            mock.add_matcher(custom_matcher)
-            c = SMSAPIClient(api_key="Invalid Key")
-            self.assertRaises(NotAuthorizedError, c.status, "xxxxxxx")
-
-    def test_status_404(self):
-        def custom_matcher(request):
-            self._test_request_get(request, "Invalid SID")
-            resp = requests.Response()
-            resp.status_code = 404
-            # normally the header field content type is referred in the message between \'\'
-            resp._content = b'{\n' + \
-                            b'    "timestamp": "2023-01-11T08:06:51.631+00:00",\n' + \
-                            b'    "path": "/service/sms/v1/messages/xxxxxxx",\n' + \
-                            b'    "status": 404,\n' + \
-                            b'    "error": "Not Found",\n' + \
-                            b'    "message": "Message: xxxxxxx not found",\n' + \
-                            b'    "requestId": "ffc84d0f-164227"\n' + \
-                            b'}'
-            return resp
-
-        with requests_mock.Mocker() as mock:
-            mock.add_matcher(custom_matcher)
-            c = SMSAPIClient(api_key="Invalid SID")
-            self.assertRaises(MessageNotFoundError, c.status, "xxxxxxx")
-
-    def test_status_500(self):
-        def custom_matcher(request):
-            self._test_request_get(request, "Server Error")
-            resp = requests.Response()
-            resp.status_code = 500
-            resp._content = b'{\n' + \
-                            b'    "timestamp": "2023-01-11T08:06:51.631+00:00",\n' + \
-                            b'    "path": "/service/sms/v1/messages/xxxxxxx",\n' + \
-                            b'    "status": 500,\n' + \
-                            b'    "error": "Internal Server Error",\n' + \
-                            b'    "message": "Something went wrong.",\n' + \
-                            b'    "requestId": "ffc84d0f-164227"\n' + \
-                            b'}'
-            return resp
-
-        with requests_mock.Mocker() as mock:
-            mock.add_matcher(custom_matcher)
-            c = SMSAPIClient(api_key="Server Error")
-            self.assertRaises(InternalSMSAPIError, c.status, "xxxxxxx")
-
-    def test_status_xxx_future_error(self):
-        def custom_matcher(request):
-            self._test_request_get(request, "Future3")
-            resp = requests.Response()
-            resp.status_code = 499
-            resp._content = b'{\n' + \
-                            b'    "timestamp": "2023-01-11T08:06:51.631+00:00",\n' + \
-                            b'    "path": "/service/sms/v1/messages/xxxxxxx",\n' + \
-                            b'    "status": 499,\n' + \
-                            b'    "error": "Future Error",\n' + \
-                            b'    "message": "In the future I do not want to do SMS anymore ;-)",\n' + \
-                            b'    "requestId": "ffc84d0f-164227"\n' + \
-                            b'}'
-            return resp
-
-        with requests_mock.Mocker() as mock:
-            mock.add_matcher(custom_matcher)
-            c = SMSAPIClient(api_key="Future3")
-            self.assertRaises(SMSAPIError, c.status, "xxxxxxx")
+        self.mocker.add_matcher(partial(_status_200_matcher, testcase=self, content=self.ACCEPTED_BODY_2_SEGMENTS))
+        c = self._client("Good Case")
+        with self.assertLogs() as captured:
+            r = c.status("23bcd1bb62dc2248596d52e9")
+        # num_segments is set wrong in the canned body to simulate the API splitting more than we assume
+        self._assert_accepted_response(r, num_segments=2)
+        # when SDK and API calculate different num seg, SDK places a warning in the logs
+        self.assertEqual(len(captured.records), 1)
+        self.assertEqual(captured.records[0].getMessage(),
+                         "DT SMS API split the message into 2 while SDK calculates 1 splits!")
+
+    def test_status_error_responses(self):
+        for api_key, status, content, expected_error in self.STATUS_ERROR_RESPONSES:
+            with self.subTest(api_key=api_key, status=status, expected_error=expected_error):
+                self._reset_matchers()
+                self.mocker.add_matcher(partial(_get_error_matcher, testcase=self, api_key=api_key,
+                                                status_code=status, content=content))
+                c = self._client(api_key)
+                self.assertRaises(expected_error, c.status, "xxxxxxx")
 
     def test_status_usage(self):
-        c = SMSAPIClient(api_key="usage")
+        c = self._client("usage")
         self.assertRaises(ValueError, c.status, 1)
         self.assertRaises(ValueError, c.status, None)
 
     def test_send_and_status(self):
-        def custom_matcher(request):
-            resp = requests.Response()
-            resp.status_code = 200
-            if request.method == "POST":
-                resp._content = b'{\n' + \
-                                b'    "sid":"23bcd1bb62dc2248596d52e9",\n' + \
-                                b'    "date_created":"Wed, 11 Jan 2023 15:11:55 +0000",\n' + \
-                                b'    "date_updated":"Wed, 11 Jan 2023 15:11:56 +0000",\n' + \
-                                b'    "from":"+491755555555",\n' + \
-                                b'    "to":"+4915111111111",\n' + \
-                                b'    "body":"Hello World",\n' + \
-                                b'    "status":"accepted",\n' + \
-                                b'    "uri":"/service/sms/v1/messages/23bcd1bb62dc2248596d52e9",\n' + \
-                                b'    "direction":"outbound-api",\n' + \
-                                b'    "api_version":"1.1.5",\n' + \
-                                b'    "num_segments":1\n' + \
-                                b'}'
-            else:
-                resp._content = b'{\n' + \
-                                b'    "sid":"23bcd1bb62dc2248596d52e9",\n' + \
-                                b'    "date_created":"Wed, 11 Jan 2023 15:11:55 +0000",\n' + \
-                                b'    "date_updated":"Wed, 11 Jan 2023 15:11:58 +0000",\n' + \
-                                b'    "from":"+491755555555",\n' + \
-                                b'    "to":"+4915111111111",\n' + \
-                                b'    "body":"Hello World",\n' + \
-                                b'    "status":"delivered",\n' + \
-                                b'    "uri":"/service/sms/v1/messages/23bcd1bb62dc2248596d52e9",\n' + \
-                                b'    "direction":"outbound-api",\n' + \
-                                b'    "api_version":"1.1.5",\n' + \
-                                b'    "num_segments":1\n' + \
-                                b'}'
-            return resp
-
-        with requests_mock.Mocker() as mock:
-            mock.add_matcher(custom_matcher)
-            c = SMSAPIClient(api_key="Full")
-            m = Message(sender="+491755555555", recipient="+4915111111111", body="Hello World")
-            r1 = c.send(m)
-            self.assertEqual(r1.sid, "23bcd1bb62dc2248596d52e9")
-            self.assertEqual(r1.date_created, datetime(year=2023, month=1, day=11,
-                                                      hour=15, minute=11, second=55, tzinfo=timezone.utc))
-            self.assertEqual(r1.date_updated, datetime(year=2023, month=1, day=11,
-                                                      hour=15, minute=11, second=56, tzinfo=timezone.utc))
-            self.assertTrue(isinstance(r1.message, Message))
-            self.assertEqual(str(r1.message.sender), "+491755555555")
-            self.assertEqual(str(r1.message.recipient), "+4915111111111")
-            self.assertEqual(r1.message.body, "Hello World")
-            self.assertEqual(r1.status, SMSAPIMessageStatus.ACCEPTED)
-            self.assertEqual(r1.uri, "/service/sms/v1/messages/23bcd1bb62dc2248596d52e9")
-            self.assertEqual(r1.direction, SMSMessageDirection.OUTBOUND)
-            self.assertEqual(r1.api_version, "1.1.5")
-            self.assertEqual(r1.num_segments, 1)
-            # querying status by passing the response from sending!
-            r2 = c.status(r1)
-            self.assertEqual(r2.sid, r1.sid)
-            self.assertEqual(r2.date_created, r2.date_created)
-            self.assertEqual(r2.date_updated, datetime(year=2023, month=1, day=11,
-                                                       hour=15, minute=11, second=58, tzinfo=timezone.utc))
-            self.assertTrue(isinstance(r2.message, Message))
-            self.assertEqual(str(r2.message.sender), str(r1.message.sender))
-            self.assertEqual(str(r2.message.recipient), str(r1.message.recipient))
-            self.assertEqual(r2.message.body, r1.message.body)
-            self.assertEqual(r2.status, SMSAPIMessageStatus.DELIVERED)
-            self.assertEqual(r2.uri, r1.uri)
-            self.assertEqual(r2.direction, r1.direction)
-            self.assertEqual(r2.api_version, r1.api_version)
-            self.assertEqual(r2.num_segments, r1.num_segments)
+        self.mocker.add_matcher(partial(_send_and_status_matcher, testcase=self))
+        c = self._client("Full")
+        r1 = c.send(self.message)
+        self._assert_accepted_response(r1)
+        # querying status by passing the response from sending!
+        r2 = c.status(r1)
+        self.assertEqual(r2.sid, r1.sid)
+        self.assertEqual(r2.date_created, r2.date_created)
+        self.assertEqual(r2.date_updated, self.DATE_UPDATED_DELIVERED)
+        self.assertTrue(isinstance(r2.message, Message))
+        self.assertEqual(str(r2.message.sender), str(r1.message.sender))
+        self.assertEqual(str(r2.message.recipient), str(r1.message.recipient))
+        self.assertEqual(r2.message.body, r1.message.body)
+        self.assertEqual(r2.status, SMSAPIMessageStatus.DELIVERED)
+        self.assertEqual(r2.uri, r1.uri)
+        self.assertEqual(r2.direction, r1.direction)
+        self.assertEqual(r2.api_version, r1.api_version)
+        self.assertEqual(r2.num_segments, r1.num_segments)
 
 